@@ -2,6 +2,7 @@
 """Alembic migration environment."""
 # ruff: noqa: I001 - Imports structured for Jinja2 template conditionals
 
+import os
 from logging.config import fileConfig
 
 from alembic import context
@@ -10,13 +11,14 @@ from sqlalchemy import engine_from_config, pool
 from app.core.config import settings
 from app.db.base import Base
 
-# Import all models here to ensure they are registered with metadata
-from app.db.models.user import User  # noqa: F401
+# Import the models package so every model is registered with metadata
+import app.db.models  # noqa: F401
 
 config = context.config
 
-if config.config_file_name is not None:
-    fileConfig(config.config_file_name)
+# Set ALEMBIC_QUIET=1 to keep the caller's logging setup (e.g. when run from the app CLI)
+if config.config_file_name is not None and os.getenv("ALEMBIC_QUIET") != "1":
+    fileConfig(config.config_file_name, disable_existing_loggers=False)
 target_metadata = Base.metadata
 
 
@@ -4,30 +4,72 @@
 The main conversational agent that can be extended with custom tools.
 """
 
+import hashlib
+import json
 import logging
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any
 
-from pydantic_ai import Agent, RunContext
+import httpx
+from pydantic_ai import Agent, AgentRun, AgentRunResult, PartDeltaEvent, RunContext, TextPartDelta
 from pydantic_ai.messages import (
+    ModelMessage,
     ModelRequest,
     ModelResponse,
     SystemPromptPart,
     TextPart,
+    ToolCallPart,
+    ToolReturnPart,
     UserPromptPart,
 )
 from pydantic_ai.models.openai import OpenAIChatModel
 from pydantic_ai.providers.openai import OpenAIProvider
 from pydantic_ai.settings import ModelSettings
 
-from app.agents.prompts import DEFAULT_SYSTEM_PROMPT
+from app.agents.prompts import DEFAULT_SYSTEM_PROMPT, HISTORY_SUMMARY_PROMPT
 from app.agents.tools import get_current_datetime
+from app.core.cache import TTLCache
 from app.core.config import settings
 
+# Try to import tiktoken for exact token counts
+try:
+    import tiktoken
+
+    HAS_TIKTOKEN = True
+except ImportError:
+    HAS_TIKTOKEN = False
+
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+# Connection pool shared by every OpenAI model in this process
+_HTTP_LIMITS = httpx.Limits(max_connections=200, max_keepalive_connections=100)
+_HTTP_TIMEOUT = httpx.Timeout(60.0, connect=5.0)
+
+
+@lru_cache(maxsize=1)
+def get_http_client() -> httpx.AsyncClient:
+    """Get the shared HTTP client used for OpenAI requests.
+
+    HTTP/2 multiplexes concurrent chat completions over a few keep-alive
+    connections instead of opening one connection per in-flight request.
+    """
+    return httpx.AsyncClient(http2=True, limits=_HTTP_LIMITS, timeout=_HTTP_TIMEOUT)
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client, if it was created."""
+    if get_http_client.cache_info().currsize:
+        await get_http_client().aclose()
+        get_http_client.cache_clear()
+
+
+@dataclass(slots=True)
 class Deps:
     """Dependencies for the assistant agent.
 
@@ -36,9 +78,171 @@ class Deps:
 
     user_id: str | None = None
     user_name: str | None = None
+    conversation_id: str | None = None
     metadata: dict[str, Any] = field(default_factory=dict)
 
 
+_ROLE_TO_MESSAGE: dict[str, Callable[[str], ModelMessage]] = {
+    "user": lambda content: ModelRequest(parts=[UserPromptPart(content=content)]),
+    "assistant": lambda content: ModelResponse(parts=[TextPart(content=content)]),
+    "system": lambda content: ModelRequest(parts=[SystemPromptPart(content=content)]),
+}
+
+
+def build_model_history(history: list[dict[str, str]]) -> list[ModelMessage]:
+    """Convert conversation history to PydanticAI message format.
+
+    Messages with an unknown role are skipped.
+    """
+    return [
+        _ROLE_TO_MESSAGE[msg["role"]](msg["content"])
+        for msg in history
+        if msg["role"] in _ROLE_TO_MESSAGE
+    ]
+
+
+async def coalesce_text_deltas(
+    events: AsyncIterator[Any],
+    interval: float = 0.02,
+) -> AsyncIterator[Any]:
+    """Merge consecutive text deltas of a model response stream.
+
+    Models emit roughly one event per token, and forwarding each one costs a
+    coroutine switch and a WebSocket frame. Text deltas for the same part are
+    concatenated until `interval` seconds have passed since the first buffered
+    delta, or until any other event arrives. All other events (part starts, tool
+    call deltas, final result) are passed through unchanged and in order.
+    """
+    buffer_index: int | None = None
+    buffer: list[str] = []
+    buffer_started = 0.0
+
+    def flush() -> PartDeltaEvent:
+        return PartDeltaEvent(
+            index=buffer_index, delta=TextPartDelta(content_delta="".join(buffer))
+        )
+
+    async for event in events:
+        is_text = isinstance(event, PartDeltaEvent) and isinstance(event.delta, TextPartDelta)
+        if buffer and (not is_text or event.index != buffer_index):
+            yield flush()
+            buffer = []
+        if not is_text:
+            yield event
+            continue
+
+        if not buffer:
+            buffer_index = event.index
+            buffer_started = time.monotonic()
+        buffer.append(event.delta.content_delta)
+        if time.monotonic() - buffer_started >= interval:
+            yield flush()
+            buffer = []
+
+    if buffer:
+        yield flush()
+
+
+@lru_cache(maxsize=8)
+def _get_encoding(model_name: str) -> Any | None:
+    """Get the tiktoken encoding for a model, falling back to o200k_base.
+
+    tiktoken downloads encodings on first use, so loading can fail (e.g. with
+    no network access). Returns None in that case; the result is cached either
+    way, so a failing download isn't retried on every call.
+    """
+    try:
+        try:
+            return tiktoken.encoding_for_model(model_name)
+        except KeyError:
+            return tiktoken.get_encoding("o200k_base")
+    except Exception:
+        logger.warning(f"Could not load a tiktoken encoding for {model_name}, estimating tokens")
+        return None
+
+
+def count_tokens(text: str, model_name: str) -> int:
+    """Count tokens in text, estimating ~4 characters per token without tiktoken."""
+    encoding = _get_encoding(model_name) if HAS_TIKTOKEN else None
+    if encoding is None:
+        return len(text) // 4 + 1
+    return len(encoding.encode(text))
+
+
+@lru_cache(maxsize=4096)
+def _message_tokens(content: str, model_name: str) -> int:
+    """Token count of one history message.
+
+    Clients resend the whole history every turn, so each message would
+    otherwise be re-tokenized on every turn of the conversation.
+    """
+    return count_tokens(content, model_name)
+
+
+def _hash_messages(hasher: Any, messages: list[dict[str, str]]) -> Any:
+    """Feed the role and content of each message into hasher and return it.
+
+    Each value is length-prefixed, so different message lists never feed the
+    same bytes.
+    """
+    for msg in messages:
+        for value in (msg["role"], msg["content"]):
+            data = value.encode("utf-8")
+            hasher.update(len(data).to_bytes(8, "little"))
+            hasher.update(data)
+    return hasher
+
+
+class _HistoryCache:
+    """Converted message history per conversation, extended incrementally.
+
+    Each entry stores how many source messages were converted, a hash of those
+    messages and the converted messages. The cached conversion is only reused
+    if the same prefix of the new history hashes to the same value, so a
+    client rewriting any earlier message gets a fresh conversion.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._data: OrderedDict[str, tuple[int, bytes, list[ModelMessage]]] = OrderedDict()
+
+    def build(self, conversation_id: str, history: list[dict[str, str]]) -> list[ModelMessage]:
+        """Return the converted history, only converting messages not seen before."""
+        count, converted = 0, []
+        hasher = hashlib.blake2b(digest_size=16)
+
+        entry = self._data.get(conversation_id)
+        if entry is not None and entry[0] <= len(history):
+            cached_count, cached_digest, cached_converted = entry
+            prefix_hasher = _hash_messages(hashlib.blake2b(digest_size=16), history[:cached_count])
+            if prefix_hasher.digest() == cached_digest:
+                count, converted, hasher = cached_count, cached_converted, prefix_hasher
+
+        new_messages = history[count:]
+        converted = converted + build_model_history(new_messages)
+        if history:
+            digest = _hash_messages(hasher, new_messages).digest()
+            self._data[conversation_id] = (len(history), digest, converted)
+            self._data.move_to_end(conversation_id)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+        return converted
+
+    def clear(self) -> None:
+        """Drop all cached conversations."""
+        self._data.clear()
+
+
+_response_cache: TTLCache[str, str] = TTLCache(
+    maxsize=settings.AI_RESPONSE_CACHE_SIZE,
+    ttl=settings.AI_RESPONSE_CACHE_TTL,
+)
+
+_history_cache = _HistoryCache(maxsize=1024)
+
+_summary_cache: TTLCache[str, str] = TTLCache(maxsize=1024, ttl=settings.AI_RESPONSE_CACHE_TTL)
+
+
 class AssistantAgent:
     """Assistant agent wrapper for conversational AI.
 
@@ -52,15 +256,20 @@ class AssistantAgent:
         system_prompt: str | None = None,
     ):
         self.model_name = model_name or settings.AI_MODEL
-        self.temperature = temperature or settings.AI_TEMPERATURE
+        self.temperature = temperature if temperature is not None else settings.AI_TEMPERATURE
         self.system_prompt = system_prompt or DEFAULT_SYSTEM_PROMPT
+        if self.system_prompt != DEFAULT_SYSTEM_PROMPT:
+            # Custom prompts must still be static (see app.agents.prompts); per-user
+            # context belongs in Deps/tools, otherwise provider prompt caching misses
+            logger.warning("AssistantAgent created with a non-default system prompt")
         self._agent: Agent[Deps, str] | None = None
+        self._summarizer: Agent[None, str] | None = None
 
     def _create_agent(self) -> Agent[Deps, str]:
         """Create and configure the PydanticAI agent."""
         model = OpenAIChatModel(
             self.model_name,
-            provider=OpenAIProvider(api_key=settings.OPENAI_API_KEY),
+            provider=OpenAIProvider(api_key=settings.OPENAI_API_KEY, http_client=get_http_client()),
         )
 
         agent = Agent[Deps, str](
@@ -91,6 +300,131 @@ class AssistantAgent:
             self._agent = self._create_agent()
         return self._agent
 
+    @property
+    def summarizer(self) -> Agent[None, str]:
+        """Get or create the agent used to summarize old conversation turns."""
+        if self._summarizer is None:
+            self._summarizer = Agent[None, str](
+                model=OpenAIChatModel(
+                    settings.AI_SUMMARY_MODEL,
+                    provider=OpenAIProvider(
+                        api_key=settings.OPENAI_API_KEY, http_client=get_http_client()
+                    ),
+                ),
+                model_settings=ModelSettings(temperature=0.0),
+                system_prompt=HISTORY_SUMMARY_PROMPT,
+            )
+        return self._summarizer
+
+    async def _compact_history(
+        self,
+        history: list[dict[str, str]] | None,
+    ) -> list[dict[str, str]]:
+        """Bound the history sent to the model.
+
+        Once the conversation exceeds AI_MAX_HISTORY_TOKENS, older messages are
+        replaced by a single system message summarizing them. The cut-off moves in
+        steps of AI_HISTORY_KEEP_MESSAGES, so the summarized prefix (and its cached
+        summary) stays the same for several consecutive turns.
+        """
+        if not history or settings.AI_MAX_HISTORY_TOKENS <= 0:
+            return history or []
+
+        keep = max(settings.AI_HISTORY_KEEP_MESSAGES, 1)
+        prefix_len = (len(history) - keep) // keep * keep
+        if prefix_len <= 0:
+            return history
+
+        total_tokens = sum(_message_tokens(msg["content"], self.model_name) for msg in history)
+        if total_tokens <= settings.AI_MAX_HISTORY_TOKENS:
+            return history
+
+        summary = await self._summarize(history[:prefix_len])
+        return [
+            {"role": "system", "content": f"Summary of the earlier conversation: {summary}"},
+            *history[prefix_len:],
+        ]
+
+    async def _summarize(self, messages: list[dict[str, str]]) -> str:
+        """Summarize messages, reusing a cached summary for the same messages."""
+        transcript = "\n".join(f"{msg['role']}: {msg['content']}" for msg in messages)
+        key = hashlib.blake2b(transcript.encode("utf-8"), digest_size=16).hexdigest()
+        if (cached := _summary_cache.get(key)) is not None:
+            return cached
+
+        logger.info(f"Summarizing {len(messages)} history messages")
+        result = await self.summarizer.run(transcript)
+        _summary_cache.set(key, result.output)
+        return result.output
+
+    @staticmethod
+    def _build_model_history(
+        history: list[dict[str, str]] | None,
+        deps: Deps,
+    ) -> list[ModelMessage]:
+        """Convert history to PydanticAI messages.
+
+        When the deps carry a conversation_id, the converted prefix is cached so
+        only messages appended since the previous turn are converted.
+        """
+        if not history:
+            return []
+        if deps.conversation_id is None:
+            return build_model_history(history)
+        return _history_cache.build(deps.conversation_id, history)
+
+    def _response_cache_key(
+        self,
+        user_input: str,
+        history: list[dict[str, str]] | None,
+    ) -> str | None:
+        """Build the response cache key, or None if this agent's output isn't cacheable.
+
+        Only low-temperature agents are cached, since sampled answers are not
+        expected to repeat verbatim.
+        """
+        if self.temperature > settings.AI_RESPONSE_CACHE_MAX_TEMPERATURE:
+            return None
+        payload = json.dumps(
+            [self.model_name, self.temperature, self.system_prompt, history or [], user_input],
+            sort_keys=True,
+            ensure_ascii=False,
+        )
+        return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+    def cached_output(
+        self,
+        user_input: str,
+        history: list[dict[str, str]] | None = None,
+    ) -> str | None:
+        """Return the cached output for this turn, if there is one.
+
+        Args:
+            user_input: User's message.
+            history: Conversation history.
+
+        Returns:
+            The output of an earlier identical turn, or None.
+        """
+        cache_key = self._response_cache_key(user_input, history)
+        return _response_cache.get(cache_key) if cache_key is not None else None
+
+    @staticmethod
+    def _cache_output(cache_key: str | None, result: AgentRunResult[str]) -> list[Any]:
+        """Cache the output of a finished run and return its tool call events."""
+        # History passed in is plain text, so tool parts can only appear in this run's messages
+        tool_events: list[Any] = [
+            part
+            for message in result.new_messages()
+            for part in message.parts
+            if isinstance(part, (ToolCallPart, ToolReturnPart))
+        ]
+
+        # Tool turns depend on live state (e.g. the current time), so never cache them
+        if cache_key is not None and not tool_events:
+            _response_cache.set(cache_key, result.output)
+        return tool_events
+
     async def run(
         self,
         user_input: str,
@@ -107,71 +441,68 @@ class AssistantAgent:
         Returns:
             Tuple of (output_text, tool_events, deps).
         """
-        model_history: list[ModelRequest | ModelResponse] = []
+        agent_deps = deps if deps is not None else Deps()
 
-        for msg in history or []:
-            if msg["role"] == "user":
-                model_history.append(ModelRequest(parts=[UserPromptPart(content=msg["content"])]))
-            elif msg["role"] == "assistant":
-                model_history.append(ModelResponse(parts=[TextPart(content=msg["content"])]))
-            elif msg["role"] == "system":
-                model_history.append(ModelRequest(parts=[SystemPromptPart(content=msg["content"])]))
+        cache_key = self._response_cache_key(user_input, history)
+        if cache_key is not None and (cached := _response_cache.get(cache_key)) is not None:
+            logger.info("Agent response served from cache")
+            return cached, [], agent_deps
 
-        agent_deps = deps if deps is not None else Deps()
+        model_history = self._build_model_history(
+            await self._compact_history(history), agent_deps
+        )
 
         logger.info(f"Running agent with user input: {user_input[:100]}...")
         result = await self.agent.run(user_input, deps=agent_deps, message_history=model_history)
-
-        tool_events: list[Any] = []
-        for message in result.all_messages():
-            if hasattr(message, "parts"):
-                for part in message.parts:
-                    if hasattr(part, "tool_name"):
-                        tool_events.append(part)
+        tool_events = self._cache_output(cache_key, result)
 
         logger.info(f"Agent run complete. Output length: {len(result.output)} chars")
 
         return result.output, tool_events, agent_deps
 
+    @asynccontextmanager
     async def iter(
         self,
         user_input: str,
         history: list[dict[str, str]] | None = None,
         deps: Deps | None = None,
-    ):
+    ) -> AsyncIterator[AgentRun[Deps, str]]:
         """Stream agent execution with full event access.
 
+        The history is compacted and converted the same way as for run(), and
+        the output of a completed run is stored in the response cache. Check
+        cached_output() first to skip the model call entirely.
+
         Args:
             user_input: User's message.
             history: Conversation history.
             deps: Optional dependencies.
 
         Yields:
-            Agent events for streaming responses.
+            The PydanticAI agent run; iterate it for nodes and events.
         """
-        model_history: list[ModelRequest | ModelResponse] = []
-
-        for msg in history or []:
-            if msg["role"] == "user":
-                model_history.append(ModelRequest(parts=[UserPromptPart(content=msg["content"])]))
-            elif msg["role"] == "assistant":
-                model_history.append(ModelResponse(parts=[TextPart(content=msg["content"])]))
-            elif msg["role"] == "system":
-                model_history.append(ModelRequest(parts=[SystemPromptPart(content=msg["content"])]))
-
         agent_deps = deps if deps is not None else Deps()
+        cache_key = self._response_cache_key(user_input, history)
+        model_history = self._build_model_history(
+            await self._compact_history(history), agent_deps
+        )
 
         async with self.agent.iter(
             user_input,
             deps=agent_deps,
             message_history=model_history,
         ) as run:
-            async for event in run:
-                yield event
+            yield run
+            if run.result is not None:
+                self._cache_output(cache_key, run.result)
 
 
+@lru_cache(maxsize=1)
 def get_agent() -> AssistantAgent:
-    """Factory function to create an AssistantAgent.
+    """Return the shared AssistantAgent instance.
+
+    The agent (model, provider and registered tools) is built once per process
+    and reused across requests instead of being reconstructed on every call.
 
     Returns:
         Configured AssistantAgent instance.
@@ -196,5 +527,4 @@ async def run_agent(
     Returns:
         Tuple of (output_text, tool_events, deps).
     """
-    agent = get_agent()
-    return await agent.run(user_input, history, deps)
+    return await get_agent().run(user_input, history, deps)
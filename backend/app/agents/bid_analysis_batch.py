@@ -0,0 +1,111 @@
+"""Bid document analysis through the OpenAI Batch API.
+
+Batch jobs cost about half as much as synchronous chat completions and have
+separate rate limits, at the price of results arriving within a 24h window.
+Use this for bulk/background analysis; user-initiated "analyze now" requests
+keep using `get_bid_analysis_agent()` directly.
+"""
+
+import logging
+
+import orjson
+from openai import AsyncOpenAI
+
+from app.agents.bid_analysis import BID_ANALYSIS_MODEL, BidAnalysisDeps, build_analysis_prompt
+from app.agents.prompts import BID_ANALYSIS_SYSTEM_PROMPT
+from app.db.models.bid_document import BidDocument
+
+logger = logging.getLogger(__name__)
+
+BATCH_ENDPOINT = "/v1/chat/completions"
+BATCH_COMPLETION_WINDOW = "24h"
+
+# Batch statuses after which no more results will arrive
+BATCH_FINAL_STATUSES = frozenset({"completed", "failed", "expired", "cancelled"})
+
+
+def build_batch_input(docs: list[BidDocument]) -> bytes:
+    """Build the JSONL input file for a batch of documents.
+
+    Each line is one chat completion request, identified by the document ID.
+
+    Args:
+        docs: Documents with extracted text
+
+    Returns:
+        JSONL file content
+    """
+    lines: list[bytes] = []
+    for doc in docs:
+        deps = BidAnalysisDeps(document_id=str(doc.id), filename=doc.original_filename)
+        user_content = [
+            {"type": "text", "text": part}
+            for part in build_analysis_prompt(deps, doc.content_text or "")
+        ]
+        request = {
+            "custom_id": str(doc.id),
+            "method": "POST",
+            "url": BATCH_ENDPOINT,
+            "body": {
+                "model": BID_ANALYSIS_MODEL,
+                "messages": [
+                    {"role": "system", "content": BID_ANALYSIS_SYSTEM_PROMPT},
+                    {"role": "user", "content": user_content},
+                ],
+            },
+        }
+        lines.append(orjson.dumps(request))
+    return b"\n".join(lines) + b"\n"
+
+
+async def submit_batch(client: AsyncOpenAI, docs: list[BidDocument]) -> str:
+    """Upload documents as a batch analysis job.
+
+    Args:
+        client: OpenAI client
+        docs: Documents with extracted text
+
+    Returns:
+        OpenAI batch ID
+    """
+    input_file = await client.files.create(
+        file=("bid_analysis_batch.jsonl", build_batch_input(docs)),
+        purpose="batch",
+    )
+    batch = await client.batches.create(
+        input_file_id=input_file.id,
+        endpoint=BATCH_ENDPOINT,
+        completion_window=BATCH_COMPLETION_WINDOW,
+    )
+    logger.info(f"Submitted bid analysis batch {batch.id} with {len(docs)} documents")
+    return batch.id
+
+
+async def fetch_batch_results(client: AsyncOpenAI, batch_id: str) -> dict[str, str | None] | None:
+    """Fetch the results of a batch analysis job.
+
+    Args:
+        client: OpenAI client
+        batch_id: OpenAI batch ID
+
+    Returns:
+        None while the batch is still running. Once it has finished, a mapping of
+        document ID to the model output, or to None for requests that failed.
+    """
+    batch = await client.batches.retrieve(batch_id)
+    if batch.status not in BATCH_FINAL_STATUSES:
+        return None
+
+    results: dict[str, str | None] = {}
+    if batch.output_file_id:
+        output = await client.files.content(batch.output_file_id)
+        for line in output.content.splitlines():
+            if not line.strip():
+                continue
+            record = orjson.loads(line)
+            response = record.get("response") or {}
+            if response.get("status_code") == 200:
+                results[record["custom_id"]] = response["body"]["choices"][0]["message"]["content"]
+            else:
+                results[record["custom_id"]] = None
+    return results
@@ -1,8 +1,9 @@
-
 """Date and time utilities for agents."""
 
 from datetime import datetime
 
+_DATETIME_FORMAT = "Current date: %Y-%m-%d, Current time: %H:%M:%S"
+
 
 def get_current_datetime() -> str:
     """Get the current date and time.
@@ -10,5 +11,4 @@ def get_current_datetime() -> str:
     Returns:
         A string with the current date and time.
     """
-    now = datetime.now()
-    return f"Current date: {now.strftime('%Y-%m-%d')}, Current time: {now.strftime('%H:%M:%S')}"
+    return datetime.now().strftime(_DATETIME_FORMAT)
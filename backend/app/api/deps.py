@@ -4,14 +4,20 @@ Dependency injection factories for services, repositories, and authentication.
 """
 # ruff: noqa: I001, E402 - Imports structured for Jinja2 template conditionals
 
+import hashlib
+import time
 from typing import Annotated
+from uuid import UUID
 
 from fastapi import Depends
 from fastapi.security import OAuth2PasswordBearer
 
+from app.core.cache import TTLCache
 from app.core.config import settings
-from app.db.session import get_db_session
+from app.db.session import get_db_context, get_db_session
+from sqlalchemy import inspect as sa_inspect
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
 
 DBSession = Annotated[AsyncSession, Depends(get_db_session)]
 
@@ -37,28 +43,109 @@ def get_item_service(db: DBSession) -> ItemService:
 
 ItemSvc = Annotated[ItemService, Depends(get_item_service)]
 
+
+from app.repositories.bid_document import BidDocumentRepository
+from app.services.bid_document import BidDocumentService
+
+
+def get_bid_document_repository(db: DBSession) -> BidDocumentRepository:
+    """Create BidDocumentRepository instance with database session."""
+    return BidDocumentRepository(db)
+
+
+BidDocumentRepo = Annotated[BidDocumentRepository, Depends(get_bid_document_repository)]
+
+
+def get_bid_document_service(db: DBSession) -> BidDocumentService:
+    """Create BidDocumentService instance with database session."""
+    return BidDocumentService(db)
+
+
+BidDocumentSvc = Annotated[BidDocumentService, Depends(get_bid_document_service)]
+
 # === Authentication Dependencies ===
 
-from app.core.exceptions import AuthenticationError, AuthorizationError
+from app.core.exceptions import AuthenticationError, AuthorizationError, NotFoundError
+from app.core.security import verify_token
 from app.db.models.user import User, UserRole
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.API_V1_STR}/auth/login")
 
+# Verified access token -> session-independent copy of its (active) user.
+# Keys are token digests so raw tokens aren't kept in memory.
+_auth_cache: TTLCache[bytes, User] = TTLCache(
+    maxsize=settings.AUTH_CACHE_SIZE,
+    ttl=settings.AUTH_CACHE_TTL_SECONDS,
+)
+
+
+def _token_cache_key(token: str) -> bytes:
+    return hashlib.blake2b(token.encode("utf-8"), digest_size=16).digest()
+
+
+def _detached_copy(user: User) -> User:
+    """Copy a user's column values into a new, session-independent instance."""
+    copy = User(**{attr.key: getattr(user, attr.key) for attr in sa_inspect(User).column_attrs})
+    make_transient_to_detached(copy)
+    return copy
+
+
+def _cache_authenticated_user(token: str, payload: dict, user: User) -> None:
+    """Cache a verified token's user, never past the token's own expiry."""
+    ttl = min(settings.AUTH_CACHE_TTL_SECONDS, payload.get("exp", 0) - time.time())
+    if ttl <= 0:
+        return
+    _auth_cache.set(_token_cache_key(token), _detached_copy(user), ttl=ttl)
+
+
+def token_subject(payload: dict) -> UUID:
+    """Get the user ID a verified token was issued for.
+
+    Raises:
+        AuthenticationError: If the sub claim is missing or not a UUID.
+    """
+    try:
+        return UUID(payload["sub"])
+    except (KeyError, TypeError, ValueError, AttributeError):
+        raise AuthenticationError(message="Invalid token payload") from None
+
+
+def revoke_token(token: str) -> None:
+    """Drop a token from the authentication cache (e.g. on logout).
+
+    A hook for callers that invalidate a token; no route calls it yet. It only
+    forgets the cached user: tokens are stateless JWTs with no deny-list, so a
+    dropped token is still accepted until it expires, after a fresh user lookup.
+    """
+    _auth_cache.discard(_token_cache_key(token))
+
+
+def invalidate_user(user_id: UUID) -> None:
+    """Drop all cached tokens of a user, e.g. after their profile or role changes."""
+    _auth_cache.discard_where(lambda user: user.id == user_id)
+
 
 async def get_current_user(
     token: Annotated[str, Depends(oauth2_scheme)],
     user_service: UserSvc,
+    db: DBSession,
 ) -> User:
     """Get current authenticated user from JWT token.
 
     Returns the full User object including role information.
+    Verified tokens are cached for AUTH_CACHE_TTL_SECONDS. Changes made through
+    the users API invalidate the cache right away (invalidate_user); changes
+    made elsewhere (e.g. CLI) can take that long to apply. The same holds for
+    revocation: revoke_token drops a token's cached user, but nothing rejects
+    the token itself before it expires.
 
     Raises:
         AuthenticationError: If token is invalid or user not found.
     """
-    from uuid import UUID
-
-    from app.core.security import verify_token
+    cached_user = _auth_cache.get(_token_cache_key(token))
+    if cached_user is not None:
+        # Attach to this request's session without a SELECT
+        return await db.merge(cached_user, load=False)
 
     payload = verify_token(token)
     if payload is None:
@@ -68,14 +155,15 @@ async def get_current_user(
     if payload.get("type") != "access":
         raise AuthenticationError(message="Invalid token type")
 
-    user_id = payload.get("sub")
-    if user_id is None:
-        raise AuthenticationError(message="Invalid token payload")
-
-    user = await user_service.get_by_id(UUID(user_id))
+    user_id = token_subject(payload)
+    try:
+        user = await user_service.get_by_id(user_id)
+    except NotFoundError:
+        raise AuthenticationError(message="User not found") from None
     if not user.is_active:
         raise AuthenticationError(message="User account is disabled")
 
+    _cache_authenticated_user(token, payload, user)
     return user
 
 
@@ -98,6 +186,8 @@ class RoleChecker:
             ...
     """
 
+    __slots__ = ("required_role",)
+
     def __init__(self, required_role: UserRole) -> None:
         self.required_role = required_role
 
@@ -154,10 +244,6 @@ async def get_current_user_ws(
     Raises:
         AuthenticationError: If token is invalid or user not found.
     """
-    from uuid import UUID
-
-    from app.core.security import verify_token
-
     # Try query parameter first, then cookie
     auth_token = token or access_token
 
@@ -165,6 +251,12 @@ async def get_current_user_ws(
         await websocket.close(code=4001, reason="Missing authentication token")
         raise AuthenticationError(message="Missing authentication token")
 
+    cached_user = _auth_cache.get(_token_cache_key(auth_token))
+    if cached_user is not None:
+        # Never hand out the cached instance itself: connections sharing a
+        # token would share (and could modify) one object
+        return _detached_copy(cached_user)
+
     payload = verify_token(auth_token)
     if payload is None:
         await websocket.close(code=4001, reason="Invalid or expired token")
@@ -174,19 +266,17 @@ async def get_current_user_ws(
         await websocket.close(code=4001, reason="Invalid token type")
         raise AuthenticationError(message="Invalid token type")
 
-    user_id = payload.get("sub")
-    if user_id is None:
-        await websocket.close(code=4001, reason="Invalid token payload")
-        raise AuthenticationError(message="Invalid token payload")
-
-    from app.db.session import get_db_context
-
-    async with get_db_context() as db:
-        user_service = UserService(db)
-        user = await user_service.get_by_id(UUID(user_id))
+    try:
+        user_id = token_subject(payload)
+        async with get_db_context() as db:
+            user = await UserService(db).get_by_id(user_id)
+    except (AuthenticationError, NotFoundError) as e:
+        await websocket.close(code=4001, reason=e.message)
+        raise AuthenticationError(message=e.message) from None
 
     if not user.is_active:
         await websocket.close(code=4001, reason="User account is disabled")
         raise AuthenticationError(message="User account is disabled")
 
+    _cache_authenticated_user(auth_token, payload, user)
     return user
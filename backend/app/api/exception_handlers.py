@@ -6,17 +6,32 @@ These handlers convert domain exceptions to proper HTTP responses.
 import logging
 from typing import Union
 
+import orjson
 from fastapi import FastAPI, Request, WebSocket
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, Response
 
 from app.core.exceptions import AppException
 
 logger = logging.getLogger(__name__)
 
+# Responses copy headers into their own list, so this dict can be shared
+_AUTH_HEADERS = {"WWW-Authenticate": "Bearer"}
+
+# The generic 500 body never changes, so encode it once
+_INTERNAL_ERROR_BODY = orjson.dumps(
+    {
+        "error": {
+            "code": "INTERNAL_ERROR",
+            "message": "An unexpected error occurred",
+            "details": None,
+        }
+    }
+)
+
 
 async def app_exception_handler(
     request: Union[Request, WebSocket], exc: AppException
-) -> JSONResponse:
+) -> ORJSONResponse:
     """Handle application exceptions.
 
     Logs 5xx errors as errors and 4xx as warnings.
@@ -41,11 +56,7 @@ async def app_exception_handler(
     else:
         logger.warning(f"{exc.code}: {exc.message}", extra=log_extra)
 
-    headers: dict[str, str] = {}
-    if exc.status_code == 401:
-        headers["WWW-Authenticate"] = "Bearer"
-
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "error": {
@@ -54,13 +65,13 @@ async def app_exception_handler(
                 "details": exc.details or None,
             }
         },
-        headers=headers,
+        headers=_AUTH_HEADERS if exc.status_code == 401 else None,
     )
 
 
 async def unhandled_exception_handler(
     request: Union[Request, WebSocket], exc: Exception
-) -> JSONResponse:
+) -> Response:
     """Handle unexpected exceptions.
 
     Logs the full exception but returns a generic error to the client
@@ -76,15 +87,10 @@ async def unhandled_exception_handler(
         },
     )
 
-    return JSONResponse(
+    return Response(
+        content=_INTERNAL_ERROR_BODY,
         status_code=500,
-        content={
-            "error": {
-                "code": "INTERNAL_ERROR",
-                "message": "An unexpected error occurred",
-                "details": None,
-            }
-        },
+        media_type="application/json",
     )
 
 
@@ -0,0 +1,41 @@
+"""Response helpers for serializing trusted database objects.
+
+Returning a model (or ORM object) from a route makes FastAPI validate it
+against response_model, dump it to Python objects and then JSON-encode it.
+These helpers read the attributes and encode the JSON inside pydantic-core
+(from_attributes validation followed by dump_json), so no intermediate
+Python dicts or model instances are built field by field.
+
+Keep response_model on the route: it still documents the OpenAPI schema.
+"""
+
+from collections.abc import Iterable
+from functools import lru_cache
+from typing import Any
+
+from fastapi import Response
+from pydantic import BaseModel, TypeAdapter
+
+
+@lru_cache
+def _adapter(schema: type[BaseModel]) -> TypeAdapter:
+    return TypeAdapter(schema)
+
+
+@lru_cache
+def _list_adapter(schema: type[BaseModel]) -> TypeAdapter:
+    return TypeAdapter(list[schema])  # type: ignore[valid-type]
+
+
+def orm_response(schema: type[BaseModel], obj: Any, status_code: int = 200) -> Response:
+    """Serialize a trusted object with schema."""
+    adapter = _adapter(schema)
+    content = adapter.dump_json(adapter.validate_python(obj, from_attributes=True))
+    return Response(content=content, status_code=status_code, media_type="application/json")
+
+
+def orm_list_response(schema: type[BaseModel], objs: Iterable[Any]) -> Response:
+    """Serialize trusted objects as a JSON array with schema."""
+    adapter = _list_adapter(schema)
+    content = adapter.dump_json(adapter.validate_python(list(objs), from_attributes=True))
+    return Response(content=content, media_type="application/json")
@@ -3,9 +3,9 @@
 
 import logging
 from typing import Any
+from uuid import uuid4
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
-
 from pydantic_ai import (
     Agent,
     FinalResultEvent,
@@ -16,15 +16,9 @@ from pydantic_ai import (
     TextPartDelta,
     ToolCallPartDelta,
 )
-from pydantic_ai.messages import (
-    ModelRequest,
-    ModelResponse,
-    SystemPromptPart,
-    TextPart,
-    UserPromptPart,
-)
+from pydantic_ai.messages import TextPart
 
-from app.agents.assistant import Deps, get_agent
+from app.agents.assistant import Deps, coalesce_text_deltas, get_agent
 
 logger = logging.getLogger(__name__)
 
@@ -65,21 +59,6 @@ class AgentConnectionManager:
 manager = AgentConnectionManager()
 
 
-def build_message_history(history: list[dict[str, str]]) -> list[ModelRequest | ModelResponse]:
-    """Convert conversation history to PydanticAI message format."""
-    model_history: list[ModelRequest | ModelResponse] = []
-
-    for msg in history:
-        if msg["role"] == "user":
-            model_history.append(ModelRequest(parts=[UserPromptPart(content=msg["content"])]))
-        elif msg["role"] == "assistant":
-            model_history.append(ModelResponse(parts=[TextPart(content=msg["content"])]))
-        elif msg["role"] == "system":
-            model_history.append(ModelRequest(parts=[SystemPromptPart(content=msg["content"])]))
-
-    return model_history
-
-
 @router.websocket("/ws/agent")
 async def agent_websocket(
     websocket: WebSocket,
@@ -106,9 +85,10 @@ async def agent_websocket(
 
     await manager.connect(websocket)
 
-    # Conversation state per connection
+    # Conversation state per connection; the conversation ID lets the agent
+    # convert only the messages appended since the previous turn
     conversation_history: list[dict[str, str]] = []
-    deps = Deps()
+    deps = Deps(conversation_id=str(uuid4()))
 
     try:
         while True:
@@ -127,113 +107,119 @@ async def agent_websocket(
 
             try:
                 assistant = get_agent()
-                model_history = build_message_history(conversation_history)
-
-                # Use iter() on the underlying PydanticAI agent to stream all events
-                async with assistant.agent.iter(
-                    user_message,
-                    deps=deps,
-                    message_history=model_history,
-                ) as agent_run:
-                    async for node in agent_run:
-                        if Agent.is_user_prompt_node(node):
-                            await manager.send_event(
-                                websocket,
-                                "user_prompt_processed",
-                                {"prompt": node.user_prompt},
-                            )
-
-                        elif Agent.is_model_request_node(node):
-                            await manager.send_event(websocket, "model_request_start", {})
-
-                            async with node.stream(agent_run.ctx) as request_stream:
-                                async for event in request_stream:
-                                    if isinstance(event, PartStartEvent):
-                                        await manager.send_event(
-                                            websocket,
-                                            "part_start",
-                                            {
-                                                "index": event.index,
-                                                "part_type": type(event.part).__name__,
-                                            },
-                                        )
-                                        # Send initial content from TextPart if present
-                                        if isinstance(event.part, TextPart) and event.part.content:
+                output = assistant.cached_output(user_message, conversation_history)
+                if output is not None:
+                    # Identical low-temperature turn answered before; no model call
+                    await manager.send_event(
+                        websocket, "text_delta", {"index": 0, "content": output}
+                    )
+                    await manager.send_event(websocket, "final_result", {"output": output})
+                else:
+                    # AssistantAgent.iter compacts the history and caches the output
+                    async with assistant.iter(
+                        user_message,
+                        conversation_history,
+                        deps,
+                    ) as agent_run:
+                        async for node in agent_run:
+                            if Agent.is_user_prompt_node(node):
+                                await manager.send_event(
+                                    websocket,
+                                    "user_prompt_processed",
+                                    {"prompt": node.user_prompt},
+                                )
+
+                            elif Agent.is_model_request_node(node):
+                                await manager.send_event(websocket, "model_request_start", {})
+
+                                async with node.stream(agent_run.ctx) as request_stream:
+                                    async for event in coalesce_text_deltas(request_stream):
+                                        if isinstance(event, PartStartEvent):
                                             await manager.send_event(
                                                 websocket,
-                                                "text_delta",
+                                                "part_start",
                                                 {
                                                     "index": event.index,
-                                                    "content": event.part.content,
+                                                    "part_type": type(event.part).__name__,
                                                 },
                                             )
+                                            # Send initial content from TextPart if present
+                                            part = event.part
+                                            if isinstance(part, TextPart) and part.content:
+                                                await manager.send_event(
+                                                    websocket,
+                                                    "text_delta",
+                                                    {
+                                                        "index": event.index,
+                                                        "content": part.content,
+                                                    },
+                                                )
+
+                                        elif isinstance(event, PartDeltaEvent):
+                                            if isinstance(event.delta, TextPartDelta):
+                                                await manager.send_event(
+                                                    websocket,
+                                                    "text_delta",
+                                                    {
+                                                        "index": event.index,
+                                                        "content": event.delta.content_delta,
+                                                    },
+                                                )
+                                            elif isinstance(event.delta, ToolCallPartDelta):
+                                                await manager.send_event(
+                                                    websocket,
+                                                    "tool_call_delta",
+                                                    {
+                                                        "index": event.index,
+                                                        "args_delta": event.delta.args_delta,
+                                                    },
+                                                )
+
+                                        elif isinstance(event, FinalResultEvent):
+                                            await manager.send_event(
+                                                websocket,
+                                                "final_result_start",
+                                                {"tool_name": event.tool_name},
+                                            )
 
-                                    elif isinstance(event, PartDeltaEvent):
-                                        if isinstance(event.delta, TextPartDelta):
+                            elif Agent.is_call_tools_node(node):
+                                await manager.send_event(websocket, "call_tools_start", {})
+
+                                async with node.stream(agent_run.ctx) as handle_stream:
+                                    async for event in handle_stream:
+                                        if isinstance(event, FunctionToolCallEvent):
                                             await manager.send_event(
                                                 websocket,
-                                                "text_delta",
+                                                "tool_call",
                                                 {
-                                                    "index": event.index,
-                                                    "content": event.delta.content_delta,
+                                                    "tool_name": event.part.tool_name,
+                                                    "args": event.part.args,
+                                                    "tool_call_id": event.part.tool_call_id,
                                                 },
                                             )
-                                        elif isinstance(event.delta, ToolCallPartDelta):
+
+                                        elif isinstance(event, FunctionToolResultEvent):
                                             await manager.send_event(
                                                 websocket,
-                                                "tool_call_delta",
+                                                "tool_result",
                                                 {
-                                                    "index": event.index,
-                                                    "args_delta": event.delta.args_delta,
+                                                    "tool_call_id": event.tool_call_id,
+                                                    "content": str(event.result.content),
                                                 },
                                             )
 
-                                    elif isinstance(event, FinalResultEvent):
-                                        await manager.send_event(
-                                            websocket,
-                                            "final_result_start",
-                                            {"tool_name": event.tool_name},
-                                        )
-
-                        elif Agent.is_call_tools_node(node):
-                            await manager.send_event(websocket, "call_tools_start", {})
-
-                            async with node.stream(agent_run.ctx) as handle_stream:
-                                async for event in handle_stream:
-                                    if isinstance(event, FunctionToolCallEvent):
-                                        await manager.send_event(
-                                            websocket,
-                                            "tool_call",
-                                            {
-                                                "tool_name": event.part.tool_name,
-                                                "args": event.part.args,
-                                                "tool_call_id": event.part.tool_call_id,
-                                            },
-                                        )
-
-                                    elif isinstance(event, FunctionToolResultEvent):
-                                        await manager.send_event(
-                                            websocket,
-                                            "tool_result",
-                                            {
-                                                "tool_call_id": event.tool_call_id,
-                                                "content": str(event.result.content),
-                                            },
-                                        )
-
-                        elif Agent.is_end_node(node) and agent_run.result is not None:
-                            await manager.send_event(
-                                websocket,
-                                "final_result",
-                                {"output": agent_run.result.output},
-                            )
+                            elif Agent.is_end_node(node) and agent_run.result is not None:
+                                await manager.send_event(
+                                    websocket,
+                                    "final_result",
+                                    {"output": agent_run.result.output},
+                                )
+                    output = agent_run.result.output if agent_run.result else None
 
                 # Update conversation history
                 conversation_history.append({"role": "user", "content": user_message})
-                if agent_run.result:
-                    conversation_history.append(
-                        {"role": "assistant", "content": agent_run.result.output}
-                    )
+                if output is not None:
+                    conversation_history.append({"role": "assistant", "content": output})
 
                 await manager.send_event(websocket, "complete", {
                 })
@@ -2,13 +2,13 @@
 """Authentication routes."""
 
 from typing import Annotated
-from uuid import UUID
 
 from fastapi import APIRouter, Depends, status
 from fastapi.security import OAuth2PasswordRequestForm
 
-from app.api.deps import CurrentUser, UserSvc
-from app.core.exceptions import AuthenticationError
+from app.api.deps import CurrentUser, UserSvc, token_subject
+from app.api.responses import orm_response
+from app.core.exceptions import AuthenticationError, NotFoundError
 from app.core.security import create_access_token, create_refresh_token, verify_token
 from app.schemas.token import RefreshTokenRequest, Token
 from app.schemas.user import UserCreate, UserRead
@@ -29,7 +29,10 @@ async def login(
     user = await user_service.authenticate(form_data.username, form_data.password)
     access_token = create_access_token(subject=str(user.id))
     refresh_token = create_refresh_token(subject=str(user.id))
-    return Token(access_token=access_token, refresh_token=refresh_token)
+    # Tokens are generated server-side, so skip re-validating them
+    return Token.model_construct(
+        access_token=access_token, refresh_token=refresh_token, token_type="bearer"
+    )
 
 
 @router.post("/register", response_model=UserRead, status_code=status.HTTP_201_CREATED)
@@ -62,21 +65,22 @@ async def refresh_token(
     if payload.get("type") != "refresh":
         raise AuthenticationError(message="Invalid token type")
 
-    user_id = payload.get("sub")
-    if user_id is None:
-        raise AuthenticationError(message="Invalid token payload")
-
     # Verify user still exists and is active
-    user = await user_service.get_by_id(UUID(user_id))
+    try:
+        user = await user_service.get_by_id(token_subject(payload))
+    except NotFoundError:
+        raise AuthenticationError(message="User not found") from None
     if not user.is_active:
         raise AuthenticationError(message="User account is disabled")
 
     access_token = create_access_token(subject=str(user.id))
     new_refresh_token = create_refresh_token(subject=str(user.id))
-    return Token(access_token=access_token, refresh_token=new_refresh_token)
+    return Token.model_construct(
+        access_token=access_token, refresh_token=new_refresh_token, token_type="bearer"
+    )
 
 
 @router.get("/me", response_model=UserRead)
 async def get_current_user_info(current_user: CurrentUser):
     """Get current authenticated user information."""
-    return current_user
+    return orm_response(UserRead, current_user)
@@ -1,33 +1,48 @@
 """Bid document API routes."""
 
-import json
-from uuid import UUID
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime, timedelta
 from typing import Any
+from uuid import UUID
 
-from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import APIRouter, BackgroundTasks, File, HTTPException, UploadFile, status
 
-from app.api.deps import CurrentUser, DBSession
+from app.api.deps import BidDocumentRepo, BidDocumentSvc, CurrentUser, DBSession
+from app.api.responses import orm_list_response, orm_response
+from app.core.config import settings
 from app.db.models.bid_document import BidDocument
-from app.db.models.user import User
-from app.repositories.bid_document import BidDocumentRepository
-from app.schemas.bid_document import (
-    BidDocumentCreate,
-    BidDocumentResponse,
-    BidDocumentUpdate,
-)
-from app.services.bid_document import BidDocumentService
+from app.schemas.bid_document import BidDocumentResponse, BidDocumentStatus
+from app.services.bid_document import UPLOAD_CHUNK_SIZE, run_analysis
 
 router = APIRouter()
 
 
+def _analysis_in_progress(doc: BidDocument) -> bool:
+    """Whether the document has a live analysis run.
+
+    A run that started more than ANALYSIS_STALE_AFTER seconds ago (e.g. its
+    worker was killed), or has no recorded start, no longer counts, so the
+    document can be re-queued.
+    """
+    if doc.analysis_status != "analyzing" or doc.analysis_started_at is None:
+        return False
+    stale_at = doc.analysis_started_at + timedelta(seconds=settings.ANALYSIS_STALE_AFTER)
+    return datetime.now(UTC) < stale_at
+
+
+async def _iter_upload(file: UploadFile) -> AsyncIterator[bytes]:
+    """Yield an uploaded file in chunks without buffering it in memory."""
+    while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+        yield chunk
+
+
 @router.post("/upload", response_model=BidDocumentResponse, status_code=status.HTTP_201_CREATED)
 async def upload_bid_document(
+    current_user: CurrentUser,
+    service: BidDocumentSvc,
     file: UploadFile = File(...),
     project_name: str | None = None,
     bidder_name: str | None = None,
-    current_user: User = Depends(CurrentUser),
-    db: AsyncSession = Depends(DBSession),
 ) -> Any:
     """Upload a bid document for analysis.
 
@@ -36,19 +51,15 @@ async def upload_bid_document(
         project_name: Optional project name
         bidder_name: Optional bidder name
         current_user: Currently authenticated user
-        db: Database session
+        service: Bid document service
 
     Returns:
         Created bid document
     """
-    # Read file content
-    file_content = await file.read()
     file_type = file.content_type or "application/octet-stream"
 
-    # Create service and upload
-    service = BidDocumentService(db)
     doc = await service.upload_file(
-        file_content=file_content,
+        chunks=_iter_upload(file),
         original_filename=file.filename or "unknown",
         file_type=file_type,
         user_id=current_user.id,
@@ -62,20 +73,19 @@ async def upload_bid_document(
 @router.get("/{doc_id}", response_model=BidDocumentResponse)
 async def get_bid_document(
     doc_id: UUID,
-    current_user: User = Depends(CurrentUser),
-    db: AsyncSession = Depends(DBSession),
+    current_user: CurrentUser,
+    repo: BidDocumentRepo,
 ) -> Any:
     """Get a bid document by ID.
 
     Args:
         doc_id: Document ID
         current_user: Currently authenticated user
-        db: Database session
+        repo: Bid document repository
 
     Returns:
         Bid document
     """
-    repo = BidDocumentRepository(db)
     doc = await repo.get_by_id(doc_id, current_user.id)
 
     if not doc:
@@ -84,76 +94,81 @@ async def get_bid_document(
             detail="Document not found",
         )
 
-    return doc
+    return orm_response(BidDocumentResponse, doc)
 
 
 @router.get("", response_model=list[BidDocumentResponse])
 async def list_bid_documents(
+    current_user: CurrentUser,
+    repo: BidDocumentRepo,
     skip: int = 0,
     limit: int = 100,
-    current_user: User = Depends(CurrentUser),
-    db: AsyncSession = Depends(DBSession),
 ) -> Any:
     """List all bid documents for current user.
 
     Args:
+        current_user: Currently authenticated user
+        repo: Bid document repository
         skip: Number of records to skip
         limit: Maximum number of records to return
-        current_user: Currently authenticated user
-        db: Database session
 
     Returns:
-        List of bid documents
+        List of bid documents, with the user's total document count in the
+        X-Total-Count header
     """
-    repo = BidDocumentRepository(db)
-    docs = await repo.get_list_by_user(current_user.id, skip, limit)
-    return docs
+    docs, total = await repo.get_list_by_user(current_user.id, skip, limit)
+    response = orm_list_response(BidDocumentResponse, docs)
+    response.headers["X-Total-Count"] = str(total)
+    return response
 
 
 @router.delete("/{doc_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_bid_document(
     doc_id: UUID,
-    current_user: User = Depends(CurrentUser),
-    db: AsyncSession = Depends(DBSession),
+    current_user: CurrentUser,
+    service: BidDocumentSvc,
 ) -> None:
     """Delete a bid document.
 
     Args:
         doc_id: Document ID
         current_user: Currently authenticated user
-        db: Database session
+        service: Bid document service
     """
-    repo = BidDocumentRepository(db)
-    service = BidDocumentService(db)
-
-    doc = await repo.get_by_id(doc_id, current_user.id)
-    if not doc:
+    if not await service.delete(doc_id, current_user.id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Document not found",
         )
 
-    await service.delete_file(doc)
 
-
-@router.post("/{doc_id}/analyze", response_model=BidDocumentResponse)
+@router.post(
+    "/{doc_id}/analyze",
+    response_model=BidDocumentResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
 async def analyze_bid_document(
     doc_id: UUID,
-    current_user: User = Depends(CurrentUser),
-    db: AsyncSession = Depends(DBSession),
+    background_tasks: BackgroundTasks,
+    current_user: CurrentUser,
+    repo: BidDocumentRepo,
+    db: DBSession,
 ) -> Any:
-    """Analyze a bid document using AI.
+    """Queue a bid document for AI analysis.
+
+    The analysis runs in the background; poll GET /{doc_id}/status until
+    analysis_status is "completed" or "failed".
 
     Args:
         doc_id: Document ID
+        background_tasks: Background task queue
         current_user: Currently authenticated user
-        db: Database session
+        repo: Bid document repository
+        db: Database session, shared with repo
 
     Returns:
-        Analyzed bid document
+        Queued bid document
     """
-    # Get document
-    repo = BidDocumentRepository(db)
     doc = await repo.get_by_id(doc_id, current_user.id)
 
     if not doc:
@@ -162,53 +177,50 @@ async def analyze_bid_document(
             detail="Document not found",
         )
 
-    # Extract text if not already done
-    if not doc.content_text:
-        service = BidDocumentService(db)
-        await service.extract_text_from_file(doc)
-        # Refresh doc from db
-        doc = await repo.get_by_id(doc_id, current_user.id)
-
     # Check if OPENAI_API_KEY is configured
-    from app.core.config import settings
-
     if not settings.OPENAI_API_KEY:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="OPENAI_API_KEY not configured. Please configure it in backend/.env",
         )
 
-    # Update status to analyzing
+    if _analysis_in_progress(doc):
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Analysis already in progress",
+        )
+
+    # Commit before queueing so the background task sees the new status
     await repo.update_status(doc, "analyzing")
+    await db.commit()
 
-    try:
-        # Import AI agent
-        from app.agents.bid_analysis import bid_analysis_agent, BidAnalysisDeps
+    background_tasks.add_task(run_analysis, doc.id, current_user.id)
 
-        # Create dependencies
-        deps = BidAnalysisDeps(
-            document_id=str(doc.id),
-            filename=doc.original_filename,
-        )
+    return doc
 
-        # Run analysis
-        result = await bid_analysis_agent.run(doc.content_text, deps=deps)
 
-        # Parse result as JSON
-        analysis_result = json.loads(result)
+@router.get("/{doc_id}/status", response_model=BidDocumentStatus)
+async def get_bid_document_status(
+    doc_id: UUID,
+    current_user: CurrentUser,
+    repo: BidDocumentRepo,
+) -> Any:
+    """Get the analysis status of a bid document.
 
-        # Update document with analysis result
-        await repo.update_analysis(doc, analysis_result)
+    Args:
+        doc_id: Document ID
+        current_user: Currently authenticated user
+        repo: Bid document repository
 
-        # Refresh from db
-        doc = await repo.get_by_id(doc_id, current_user.id)
+    Returns:
+        Document analysis status
+    """
+    doc = await repo.get_by_id(doc_id, current_user.id)
 
-    except Exception as e:
-        # Update status to failed
-        await repo.update_status(doc, "failed")
+    if not doc:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Analysis failed: {str(e)}",
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Document not found",
         )
 
     return doc
@@ -4,9 +4,13 @@ Provides Kubernetes-compatible health check endpoints:
 - /health - Simple liveness check
 - /health/live - Detailed liveness probe
 - /health/ready - Readiness probe with dependency checks
+- /health/db - Database connection pool usage
+- /ready - Deprecated alias for /health/ready
 """
 # ruff: noqa: I001 - Imports structured for Jinja2 template conditionals
 
+import asyncio
+import time
 from datetime import UTC, datetime
 from typing import Any
 
@@ -16,9 +20,24 @@ from sqlalchemy import text
 
 from app.core.config import settings
 from app.api.deps import DBSession
+from app.db.session import engine
 
 router = APIRouter()
 
+_SELECT_1 = text("SELECT 1")
+
+# (unix second, ISO timestamp) - probes hit these endpoints many times a second
+_timestamp_cache: tuple[int, str] = (0, "")
+
+
+def _timestamp() -> str:
+    """Current UTC time as ISO 8601, at one-second resolution."""
+    global _timestamp_cache
+    now = int(time.time())
+    if now != _timestamp_cache[0]:
+        _timestamp_cache = (now, datetime.fromtimestamp(now, UTC).isoformat())
+    return _timestamp_cache[1]
+
 
 def _build_health_response(
     status: str,
@@ -28,7 +47,7 @@ def _build_health_response(
     """Build a structured health response."""
     response: dict[str, Any] = {
         "status": status,
-        "timestamp": datetime.now(UTC).isoformat(),
+        "timestamp": _timestamp(),
         "service": settings.PROJECT_NAME,
     }
     if checks is not None:
@@ -67,11 +86,38 @@ async def liveness_probe() -> dict[str, Any]:
         details={
             "version": getattr(settings, "VERSION", "1.0.0"),
             "environment": settings.ENVIRONMENT,
+            # uvicorn picks uvloop automatically when it is installed (uvicorn[standard])
+            "event_loop": type(asyncio.get_running_loop()).__module__,
+        },
+    )
+
+
+@router.get("/health/db")
+async def database_pool_status() -> dict[str, Any]:
+    """Connection pool usage, for spotting pool exhaustion.
+
+    Doesn't touch the database: a saturated pool would otherwise make this
+    endpoint wait for a connection like every other request.
+
+    Returns:
+        Structured response with pool size and checked-in/out connections.
+    """
+    pool = engine.pool
+    return _build_health_response(
+        status="ok",
+        details={
+            "pool_size": pool.size(),
+            "checked_in": pool.checkedin(),
+            "checked_out": pool.checkedout(),
+            "overflow": pool.overflow(),
+            "max_overflow": settings.DB_MAX_OVERFLOW,
         },
     )
 
 
 @router.get("/health/ready", response_model=None)
+# Backward compatibility - /ready is served by the same handler
+@router.get("/ready", response_model=None, deprecated=True)
 async def readiness_probe(
     db: DBSession,
 ) -> dict[str, Any] | JSONResponse:
@@ -91,9 +137,9 @@ async def readiness_probe(
     checks: dict[str, dict[str, Any]] = {}
     # Database check
     try:
-        start = datetime.now(UTC)
-        await db.execute(text("SELECT 1"))
-        latency_ms = (datetime.now(UTC) - start).total_seconds() * 1000
+        start = time.perf_counter_ns()
+        await db.execute(_SELECT_1)
+        latency_ms = (time.perf_counter_ns() - start) / 1e6
         checks["database"] = {
             "status": "healthy",
             "latency_ms": round(latency_ms, 2),
@@ -120,17 +166,3 @@ async def readiness_probe(
         return JSONResponse(status_code=503, content=response_data)
 
     return response_data
-
-
-# Backward compatibility - keep /ready endpoint
-@router.get("/ready", response_model=None)
-async def readiness_check(
-    db: DBSession,
-) -> dict[str, Any] | JSONResponse:
-    """Readiness check (alias for /health/ready).
-
-    Deprecated: Use /health/ready instead.
-    """
-    return await readiness_probe(
-        db=db,
-    )
@@ -6,7 +6,7 @@ This module demonstrates a complete CRUD API for the Item entity.
 You can use it as a template for creating your own endpoints.
 
 The endpoints are:
-- GET /items - List all items (with pagination if enabled)
+- GET /items - List items, newest first (cursor pagination)
 - POST /items - Create a new item
 - GET /items/{item_id} - Get a single item by ID
 - PATCH /items/{item_id} - Update an item
@@ -15,25 +15,32 @@ The endpoints are:
 
 from uuid import UUID
 
-from fastapi import APIRouter, status
-from fastapi_pagination import Page
-from fastapi_pagination.ext.sqlalchemy import paginate
-from sqlalchemy import select
-from app.api.deps import DBSession, ItemSvc
-from app.db.models.item import Item
+from fastapi import APIRouter, Query, status
+from app.api.deps import ItemSvc
+from app.api.responses import orm_response
+from app.schemas.base import CursorPage
 from app.schemas.item import ItemCreate, ItemRead, ItemUpdate
 
 router = APIRouter()
 
 
-@router.get("", response_model=Page[ItemRead])
-async def list_items(db: DBSession):
-    """List all items with pagination.
+@router.get("", response_model=CursorPage[ItemRead])
+async def list_items(
+    item_service: ItemSvc,
+    cursor: str | None = None,
+    size: int = Query(default=50, ge=1, le=100),
+):
+    """List items with cursor pagination.
 
-    Returns a paginated list of items. Use query parameters
-    `page` and `size` to control pagination.
+    Returns items newest first. Pass the returned `next_cursor` as
+    `cursor` to get the next page.
     """
-    return await paginate(db, select(Item))
+    items, next_cursor = await item_service.get_page(cursor=cursor, size=size)
+    return {
+        "items": items,
+        "total": await item_service.count(),
+        "next_cursor": next_cursor,
+    }
 
 
 @router.post("", response_model=ItemRead, status_code=status.HTTP_201_CREATED)
@@ -57,7 +64,7 @@ async def get_item(
 
     Raises 404 if the item does not exist.
     """
-    return await item_service.get_by_id(item_id)
+    return orm_response(ItemRead, await item_service.get_by_id(item_id))
 
 
 @router.patch("/{item_id}", response_model=ItemRead)
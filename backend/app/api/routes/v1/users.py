@@ -6,18 +6,17 @@ from typing import Annotated
 
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, status
-from fastapi_pagination import Page
-from fastapi_pagination.ext.sqlalchemy import paginate
-from sqlalchemy import select
+from fastapi import APIRouter, Depends, Query, status
 
 from app.api.deps import (
-    DBSession,
     RoleChecker,
     UserSvc,
     get_current_user,
+    invalidate_user,
 )
+from app.api.responses import orm_response
 from app.db.models.user import User, UserRole
+from app.schemas.base import CursorPage
 from app.schemas.user import UserRead, UserUpdate
 
 router = APIRouter()
@@ -31,7 +30,7 @@ async def read_current_user(
 
     Returns the authenticated user's profile including their role.
     """
-    return current_user
+    return orm_response(UserRead, current_user)
 
 
 @router.patch("/me", response_model=UserRead)
@@ -49,16 +48,24 @@ async def update_current_user(
     if user_in.role is not None and not current_user.has_role(UserRole.ADMIN):
         user_in.role = None
     user = await user_service.update(current_user.id, user_in)
+    invalidate_user(current_user.id)
     return user
 
 
-@router.get("", response_model=Page[UserRead])
+@router.get("", response_model=CursorPage[UserRead])
 async def read_users(
-    db: DBSession,
+    user_service: UserSvc,
     current_user: Annotated[User, Depends(RoleChecker(UserRole.ADMIN))],
+    cursor: str | None = None,
+    size: int = Query(default=50, ge=1, le=100),
 ):
-    """Get all users (admin only)."""
-    return await paginate(db, select(User))
+    """Get all users, newest first (admin only)."""
+    users, next_cursor = await user_service.get_page(cursor=cursor, size=size)
+    return {
+        "items": users,
+        "total": await user_service.count(),
+        "next_cursor": next_cursor,
+    }
 
 
 @router.get("/{user_id}", response_model=UserRead)
@@ -89,6 +96,7 @@ async def update_user_by_id(
     Raises NotFoundError if user does not exist.
     """
     user = await user_service.update(user_id, user_in)
+    invalidate_user(user_id)
     return user
 
 
@@ -103,3 +111,4 @@ async def delete_user_by_id(
     Raises NotFoundError if user does not exist.
     """
     await user_service.delete(user_id)
+    invalidate_user(user_id)
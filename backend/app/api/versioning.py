@@ -6,6 +6,7 @@ This module provides tools for managing API version deprecation:
 - RFC 8594 compliant deprecation headers
 """
 
+import inspect
 from collections.abc import Callable
 from datetime import datetime
 from functools import wraps
@@ -15,6 +16,31 @@ from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
 
 
+def _deprecation_headers(
+    sunset: str | None = None,
+    link: str | None = None,
+    message: str | None = None,
+) -> dict[str, str]:
+    """Build RFC 8594 deprecation headers."""
+    # Deprecation header - indicates the API is deprecated
+    headers = {"Deprecation": "true"}
+
+    # Sunset header - when the API will be removed, in HTTP date format
+    if sunset:
+        sunset_date = datetime.fromisoformat(sunset)
+        headers["Sunset"] = sunset_date.strftime("%a, %d %b %Y %H:%M:%S GMT")
+
+    # Link header - documentation for migration
+    if link:
+        headers["Link"] = f'<{link}>; rel="deprecation"'
+
+    # Custom warning header
+    if message:
+        headers["X-API-Deprecation-Warning"] = message
+
+    return headers
+
+
 class VersionDeprecationMiddleware(BaseHTTPMiddleware):
     """Middleware to add deprecation headers for deprecated API versions.
 
@@ -57,45 +83,48 @@ class VersionDeprecationMiddleware(BaseHTTPMiddleware):
         super().__init__(app)
         self.deprecated_versions = deprecated_versions or {}
 
+        # Everything per-version is computed once here; dispatch() runs on every request
+        self._headers = {
+            version: _deprecation_headers(
+                sunset=info.get("sunset"),
+                link=info.get("link"),
+                message=info.get("message", f"API {version} is deprecated"),
+            )
+            for version, info in self.deprecated_versions.items()
+        }
+        self._matchers = [
+            (version, f"/api/{version}/", f"/api/{version}") for version in self.deprecated_versions
+        ]
+        self._prefixes = tuple(prefix for _, prefix, _ in self._matchers)
+        self._roots = tuple(root for _, _, root in self._matchers)
+
     async def dispatch(
         self, request: Request, call_next: RequestResponseEndpoint
     ) -> Response:
         """Process the request and add deprecation headers if needed."""
         response = await call_next(request)
+        if not self._matchers:
+            return response
 
-        # Check if request path matches a deprecated version
+        # Cheap check first: most requests don't hit a deprecated version
         path = request.url.path
-        for version, info in self.deprecated_versions.items():
-            if f"/api/{version}/" in path or path.endswith(f"/api/{version}"):
-                self._add_deprecation_headers(response, version, info)
+        if not (path.startswith(self._prefixes) or path.endswith(self._roots)):
+            return response
+
+        for version, prefix, root in self._matchers:
+            if path.startswith(prefix) or path.endswith(root):
+                response.headers.update(self._headers[version])
                 self._log_deprecated_usage(request, version)
                 break
 
         return response
 
-    def _add_deprecation_headers(
-        self, response: Response, version: str, info: dict
-    ) -> None:
-        """Add RFC 8594 deprecation headers to the response."""
-        # Deprecation header - indicates the API is deprecated
-        response.headers["Deprecation"] = "true"
-
-        # Sunset header - when the API will be removed
-        if sunset := info.get("sunset"):
-            # Convert to HTTP date format
-            sunset_date = datetime.fromisoformat(sunset)
-            response.headers["Sunset"] = sunset_date.strftime("%a, %d %b %Y %H:%M:%S GMT")
-
-        # Link header - documentation for migration
-        if link := info.get("link"):
-            response.headers["Link"] = f'<{link}>; rel="deprecation"'
-
-        # Custom warning header
-        message = info.get("message", f"API {version} is deprecated")
-        response.headers["X-API-Deprecation-Warning"] = message
-
     def _log_deprecated_usage(self, request: Request, version: str) -> None:
-        """Log usage of deprecated API version for monitoring."""
+        """Log usage of deprecated API version for monitoring.
+
+        This only records the log in memory; logfire batches and exports records
+        from a background thread, so no network I/O happens on the request path.
+        """
         logfire.warn(
             "Deprecated API version accessed",
             version=version,
@@ -132,37 +161,49 @@ def deprecated(
             ...
     """
 
+    headers = _deprecation_headers(sunset=sunset, link=link, message=message)
+
     def decorator(func: Callable) -> Callable:
-        @wraps(func)
-        async def wrapper(*args, **kwargs):
-            # Get the response from the endpoint
-            result = await func(*args, **kwargs)
-
-            # Find Response object in args (FastAPI injects it)
-            response = None
-            for arg in args:
-                if isinstance(arg, Response):
-                    response = arg
-                    break
-            for value in kwargs.values():
-                if isinstance(value, Response):
-                    response = value
-                    break
-
-            # If we have a Response object, add headers
-            if response:
-                response.headers["Deprecation"] = "true"
-                if sunset:
-                    sunset_date = datetime.fromisoformat(sunset)
-                    response.headers["Sunset"] = sunset_date.strftime(
-                        "%a, %d %b %Y %H:%M:%S GMT"
-                    )
-                if link:
-                    response.headers["Link"] = f'<{link}>; rel="deprecation"'
-                if message:
-                    response.headers["X-API-Deprecation-Warning"] = message
-
-            return result
+        # Headers go on the Response FastAPI injects. If the endpoint doesn't
+        # declare one, add a parameter for it to the signature FastAPI sees.
+        signature = inspect.signature(func)
+        params = list(signature.parameters.values())
+        response_param = next(
+            (param.name for param in params if param.annotation is Response), None
+        )
+        injected = response_param is None
+        if injected:
+            response_param = "response"
+            index = next(
+                (i for i, param in enumerate(params) if param.kind is param.VAR_KEYWORD),
+                len(params),
+            )
+            params.insert(
+                index,
+                inspect.Parameter(
+                    response_param, inspect.Parameter.KEYWORD_ONLY, annotation=Response
+                ),
+            )
+
+        def add_headers(kwargs: dict) -> None:
+            response = kwargs.pop(response_param) if injected else kwargs[response_param]
+            response.headers.update(headers)
+
+        if inspect.iscoroutinefunction(func):
+
+            @wraps(func)
+            async def wrapper(*args, **kwargs):
+                add_headers(kwargs)
+                return await func(*args, **kwargs)
+
+        else:
+
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                add_headers(kwargs)
+                return func(*args, **kwargs)
+
+        wrapper.__signature__ = signature.replace(parameters=params)
 
         # Add deprecation info to OpenAPI schema
         wrapper.__doc__ = (
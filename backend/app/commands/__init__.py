@@ -18,16 +18,15 @@ Usage:
     # project cmd my-command --option value
 """
 
+import functools
 import importlib
 import pkgutil
 from collections.abc import Callable
-from pathlib import Path
 
 import click
 
 # Registry for custom commands
 _commands: list[click.Command] = []
-_discovered = False
 
 
 def command(name: str | None = None, **kwargs) -> Callable:
@@ -54,24 +53,19 @@ def command(name: str | None = None, **kwargs) -> Callable:
     return decorator
 
 
+@functools.cache
 def discover_commands() -> list[click.Command]:
     """
     Auto-discover all commands in this package.
 
     Imports all modules in the app.commands package (except those starting with _)
-    which triggers the @command decorator to register them.
+    which triggers the @command decorator to register them. Runs once; later
+    calls return the same list.
 
     Returns:
         List of discovered click.Command objects
     """
-    global _discovered
-
-    if _discovered:
-        return _commands
-
-    package_dir = Path(__file__).parent
-
-    for _, module_name, _ in pkgutil.iter_modules([str(package_dir)]):
+    for _, module_name, _ in pkgutil.iter_modules(__path__):
         if module_name.startswith("_"):
             continue
 
@@ -80,7 +74,6 @@ def discover_commands() -> list[click.Command]:
         except ImportError as e:
             click.secho(f"Warning: Failed to import command module '{module_name}': {e}", fg="yellow")
 
-    _discovered = True
     return _commands
 
 
@@ -0,0 +1,95 @@
+"""
+Analyze pending bid documents through the OpenAI Batch API.
+
+Batch analysis costs about half as much as the synchronous /analyze endpoint.
+Run --submit periodically to queue pending documents, and --collect to store
+the results of finished batches.
+"""
+
+import asyncio
+
+import click
+import orjson
+
+from app.commands import command, error, info, success, warning
+
+
+@command("analyze-batch", help="Analyze pending bid documents via the OpenAI Batch API")
+@click.option("--submit", "mode", flag_value="submit", default=True, help="Submit pending documents")
+@click.option("--collect", "mode", flag_value="collect", help="Collect results of submitted batches")
+@click.option("--limit", "-l", default=100, type=int, help="Maximum documents per batch")
+def analyze_batch(mode: str, limit: int) -> None:
+    """
+    Submit pending documents as a batch job, or collect finished batch results.
+
+    Example:
+        project cmd analyze-batch --submit --limit 200
+        project cmd analyze-batch --collect
+    """
+    from app.core.config import settings
+
+    if not settings.OPENAI_API_KEY:
+        error("OPENAI_API_KEY not configured. Please configure it in backend/.env")
+        return
+
+    from openai import AsyncOpenAI
+
+    from app.agents.bid_analysis_batch import fetch_batch_results, submit_batch
+    from app.db.session import async_session_maker
+    from app.repositories.bid_document import BidDocumentRepository
+    from app.services.bid_document import BidDocumentService, shutdown_extraction_pool
+
+    client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+
+    async def _submit():
+        async with async_session_maker() as session:
+            service = BidDocumentService(session)
+            repo = service.repo
+            docs = await repo.get_pending_for_batch(limit=limit)
+            if not docs:
+                info("No pending documents to analyze.")
+                return
+
+            # Uploads are stored without text; extract it the way /analyze does
+            try:
+                for doc in docs:
+                    if not doc.content_text:
+                        await service.extract_text_from_file(doc)
+            finally:
+                shutdown_extraction_pool()
+
+            batch_id = await submit_batch(client, docs)
+            await repo.mark_batched(docs, batch_id)
+            await session.commit()
+            success(f"Submitted {len(docs)} documents as batch {batch_id}.")
+
+    async def _collect():
+        async with async_session_maker() as session:
+            repo = BidDocumentRepository(session)
+            batch_ids = await repo.get_open_batch_ids()
+            if not batch_ids:
+                info("No batches awaiting results.")
+                return
+
+            for batch_id in batch_ids:
+                results = await fetch_batch_results(client, batch_id)
+                if results is None:
+                    info(f"Batch {batch_id} is still running.")
+                    continue
+
+                completed = failed = 0
+                for doc in await repo.get_by_batch_id(batch_id):
+                    output = results.get(str(doc.id))
+                    try:
+                        if output is None:
+                            raise ValueError("no result returned")
+                        await repo.update_analysis(doc, orjson.loads(output))
+                        completed += 1
+                    except ValueError as e:
+                        warning(f"Analysis failed for document {doc.id}: {e}")
+                        await repo.update_status(doc, "failed")
+                        failed += 1
+                await session.commit()
+                success(f"Batch {batch_id}: {completed} completed, {failed} failed.")
+
+    asyncio.run(_submit() if mode == "submit" else _collect())
@@ -1,7 +1,8 @@
 """
 Cleanup old or stale data from the database.
 
-This command is useful for maintenance tasks.
+This command is useful for maintenance tasks. It deletes bid documents
+uploaded before the cutoff, along with their stored files.
 """
 
 import asyncio
@@ -11,6 +12,9 @@ import click
 
 from app.commands import command, info, success, warning
 
+# Rows deleted per statement; keeps each transaction and its locks short
+CLEANUP_BATCH_SIZE = 10_000
+
 
 @command("cleanup", help="Clean up old data from the database")
 @click.option("--days", "-d", default=30, type=int, help="Delete records older than N days")
@@ -34,21 +38,41 @@ def cleanup(days: int, dry_run: bool, force: bool) -> None:
     if not force and not click.confirm(f"Delete all records older than {days} days ({cutoff_date})?"):
         warning("Aborted.")
         return
+    from pathlib import Path
+
+    from sqlalchemy import delete, select
+
+    from app.db.models.bid_document import BidDocument
     from app.db.session import async_session_maker
 
     async def _cleanup():
-        async with async_session_maker() as _session:
+        async with async_session_maker() as session:
             info(f"Cleaning up records older than {cutoff_date}...")
 
-            # Add your cleanup logic here
-            # Example:
-            # result = await session.execute(
-            #     delete(YourModel).where(YourModel.created_at < cutoff_date)
-            # )
-            # await session.commit()
-            # deleted_count = result.rowcount
+            # One DELETE per batch instead of one per row
+            deleted_count = 0
+            while True:
+                expired_ids = (
+                    select(BidDocument.id)
+                    .where(BidDocument.uploaded_at < cutoff_date)
+                    .limit(CLEANUP_BATCH_SIZE)
+                )
+                result = await session.execute(
+                    delete(BidDocument)
+                    .where(BidDocument.id.in_(expired_ids.scalar_subquery()))
+                    .returning(BidDocument.file_path)
+                    .execution_options(synchronize_session=False)
+                )
+                file_paths = result.scalars().all()
+                await session.commit()
+
+                for file_path in file_paths:
+                    Path(file_path).unlink(missing_ok=True)
+                deleted_count += len(file_paths)
+
+                if len(file_paths) < CLEANUP_BATCH_SIZE:
+                    break
 
-            deleted_count = 0  # Replace with actual count
             success(f"Deleted {deleted_count} records.")
 
     asyncio.run(_cleanup())
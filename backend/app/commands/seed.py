@@ -11,13 +11,16 @@ import asyncio
 
 import random
 import string
+from collections.abc import Callable
+from typing import Any
 
 import click
 
-from sqlalchemy import delete, select
+from sqlalchemy import delete, insert, select
 
 
 from app.commands import command, info, success, warning
+from app.db.base import uuid7
 
 # Try to import Faker for better data generation
 try:
@@ -29,6 +32,22 @@ except ImportError:
     fake = None
 
 
+# Fallback vocabularies when Faker isn't installed
+FIRST_NAMES = ("John", "Jane", "Bob", "Alice", "Charlie", "Diana", "Eve", "Frank")
+LAST_NAMES = ("Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis")
+ADJECTIVES = ("Amazing", "Great", "Awesome", "Fantastic", "Incredible", "Beautiful")
+NOUNS = ("Widget", "Gadget", "Thing", "Product", "Item", "Object")
+
+# Distinct generated values per field; larger seeds sample from these with replacement
+POOL_SIZE = 1000
+
+# Minimum bcrypt cost (the default is BCRYPT_ROUNDS)
+SEED_BCRYPT_ROUNDS = 4
+
+# From this many rows on, rows are streamed with COPY instead of a multi-row INSERT
+COPY_THRESHOLD = 5000
+
+
 def random_email() -> str:
     """Generate a random email address."""
     if HAS_FAKER:
@@ -41,18 +60,14 @@ def random_name() -> str:
     """Generate a random full name."""
     if HAS_FAKER:
         return fake.name()
-    first_names = ["John", "Jane", "Bob", "Alice", "Charlie", "Diana", "Eve", "Frank"]
-    last_names = ["Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis"]
-    return f"{random.choice(first_names)} {random.choice(last_names)}"
+    return f"{random.choice(FIRST_NAMES)} {random.choice(LAST_NAMES)}"
 
 
 def random_title() -> str:
     """Generate a random item title."""
     if HAS_FAKER:
         return fake.sentence(nb_words=4).rstrip('.')
-    adjectives = ["Amazing", "Great", "Awesome", "Fantastic", "Incredible", "Beautiful"]
-    nouns = ["Widget", "Gadget", "Thing", "Product", "Item", "Object"]
-    return f"{random.choice(adjectives)} {random.choice(nouns)}"
+    return f"{random.choice(ADJECTIVES)} {random.choice(NOUNS)}"
 
 
 def random_description() -> str:
@@ -62,6 +77,40 @@ def random_description() -> str:
     return "This is a sample description for development purposes."
 
 
+def sample(generate: Callable[[], str], count: int) -> list[str]:
+    """Draw count values from a pool of at most POOL_SIZE generated ones."""
+    pool = [generate() for _ in range(min(count, POOL_SIZE))]
+    return random.choices(pool, k=count)
+
+
+def unique_emails(count: int) -> list[str]:
+    """Generate count distinct email addresses (users.email is unique)."""
+    emails = []
+    for i, email in enumerate(sample(random_email, count)):
+        local, domain = email.split("@", 1)
+        emails.append(f"{local}{i}@{domain}")
+    return emails
+
+
+async def insert_rows(session: Any, model: Any, rows: list[dict[str, Any]]) -> None:
+    """Insert rows into a model's table.
+
+    Large batches use asyncpg's binary COPY, which skips parsing and planning
+    a statement with one parameter per value.
+    """
+    if len(rows) < COPY_THRESHOLD:
+        await session.execute(insert(model), rows)
+        return
+    # COPY bypasses SQLAlchemy, so the Python-side uuid7 default is applied here
+    columns = ["id", *rows[0]]
+    records = [(uuid7(), *row.values()) for row in rows]
+    connection = await session.connection()
+    raw_connection = await connection.get_raw_connection()
+    await raw_connection.driver_connection.copy_records_to_table(
+        model.__tablename__, records=records, columns=columns
+    )
+
+
 @command("seed", help="Seed database with sample data")
 @click.option("--count", "-c", default=10, type=int, help="Number of records to create")
 @click.option("--clear", is_flag=True, help="Clear existing data before seeding")
@@ -102,14 +151,15 @@ def seed(
     from app.db.models.item import Item
 
     async def _seed():
-        async with async_session_maker() as session:
+        # One transaction for the whole seed: a single COMMIT, and a failure leaves
+        # the database as it was
+        async with async_session_maker.begin() as session:
             created_counts = {}
             # Seed users
             if users:
                 if clear:
                     info("Clearing existing users (except superusers)...")
                     await session.execute(delete(User).where(User.is_superuser == False))  # noqa: E712
-                    await session.commit()
 
                 # Check how many users already exist
                 result = await session.execute(select(User).limit(1))
@@ -119,24 +169,30 @@ def seed(
                     info("Users already exist. Use --clear to replace them.")
                 else:
                     info(f"Creating {count} sample users...")
-                    for _ in range(count):
-                        user = User(
-                            email=random_email(),
-                            hashed_password=get_password_hash("password123"),
-                            full_name=random_name(),
-                            is_active=True,
-                            is_superuser=False,
-                            role="user",
+                    # bcrypt is deliberately slow; every seed user shares one password,
+                    # hashed at the minimum cost since it only guards development data
+                    hashed_password = get_password_hash("password123", rounds=SEED_BCRYPT_ROUNDS)
+                    # Bulk-inserted instead of an ORM add() per user
+                    user_rows = [
+                        {
+                            "email": email,
+                            "hashed_password": hashed_password,
+                            "full_name": full_name,
+                            "is_active": True,
+                            "is_superuser": False,
+                            "role": "user",
+                        }
+                        for email, full_name in zip(
+                            unique_emails(count), sample(random_name, count), strict=True
                         )
-                        session.add(user)
-                    await session.commit()
+                    ]
+                    await insert_rows(session, User, user_rows)
                     created_counts["users"] = count
             # Seed items
             if items:
                 if clear:
                     info("Clearing existing items...")
                     await session.execute(delete(Item))
-                    await session.commit()
 
                 # Check how many items already exist
                 result = await session.execute(select(Item).limit(1))
@@ -146,14 +202,20 @@ def seed(
                     info("Items already exist. Use --clear to replace them.")
                 else:
                     info(f"Creating {count} sample items...")
-                    for _ in range(count):
-                        item = Item(
-                            title=random_title(),
-                            description=random_description(),
-                            is_active=random.choice([True, True, True, False]),  # 75% active
+                    item_rows = [
+                        {
+                            "title": title,
+                            "description": description,
+                            "is_active": is_active,
+                        }
+                        for title, description, is_active in zip(
+                            sample(random_title, count),
+                            sample(random_description, count),
+                            random.choices((True, False), weights=(3, 1), k=count),  # 75% active
+                            strict=True,
                         )
-                        session.add(item)
-                    await session.commit()
+                    ]
+                    await insert_rows(session, Item, item_rows)
                     created_counts["items"] = count
 
             if created_counts:
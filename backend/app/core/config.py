@@ -67,6 +67,20 @@ class Settings(BaseSettings):
     DB_POOL_SIZE: int = 5
     DB_MAX_OVERFLOW: int = 10
     DB_POOL_TIMEOUT: int = 30
+    DB_POOL_RECYCLE: int = 1800  # seconds
+    DB_POOL_PRE_PING: bool = True
+    # Hand out the most recently returned connection first: a few hot connections
+    # serve most requests with warm statement caches, and the rest can idle out
+    DB_POOL_USE_LIFO: bool = True
+    # Prepared statements cached per connection; set to 0 behind PgBouncer
+    DB_STATEMENT_CACHE_SIZE: int = 1024
+    # Compiled SQL statements cached per engine (SQLAlchemy default is 500)
+    DB_QUERY_CACHE_SIZE: int = 1200
+    # Rows per INSERT ... VALUES statement when executemany batches inserts
+    DB_INSERTMANYVALUES_PAGE_SIZE: int = 1000
+
+    # Total counts shown on paginated lists are cached for this long (seconds)
+    PAGINATION_COUNT_CACHE_TTL: int = 60
 
     # === Auth (SECRET_KEY for JWT/Session/Admin) ===
     SECRET_KEY: str = "change-me-in-production-use-openssl-rand-hex-32"
@@ -90,14 +104,34 @@ class Settings(BaseSettings):
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30  # 30 minutes
     REFRESH_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 7  # 7 days
     ALGORITHM: str = "HS256"
+    # Verified access tokens are cached with their user for this long; 0 disables the cache
+    AUTH_CACHE_TTL_SECONDS: int = 30
+    AUTH_CACHE_SIZE: int = 10_000
+    # bcrypt cost factor for stored passwords; each +1 doubles hashing time
+    BCRYPT_ROUNDS: int = 12
 
     # === AI Agent (pydantic_ai, openai) ===
     OPENAI_API_KEY: str = ""
     AI_MODEL: str = "gpt-4o-mini"
     AI_TEMPERATURE: float = 0.7
     AI_FRAMEWORK: str = "pydantic_ai"
+    # Response cache for deterministic (low-temperature) agent runs; size 0 disables it
+    AI_RESPONSE_CACHE_SIZE: int = 4096
+    AI_RESPONSE_CACHE_TTL: int = 3600  # seconds
+    AI_RESPONSE_CACHE_MAX_TEMPERATURE: float = 0.3
+    # History older than the most recent AI_HISTORY_KEEP_MESSAGES is summarized once the
+    # conversation exceeds AI_MAX_HISTORY_TOKENS; 0 disables summarization
+    AI_MAX_HISTORY_TOKENS: int = 3000
+    AI_HISTORY_KEEP_MESSAGES: int = 6
+    AI_SUMMARY_MODEL: str = "gpt-4o-mini"
     LLM_PROVIDER: str = "openai"
 
+    # === Bid documents ===
+    # Processes used to extract text from uploaded files; 0 means one per CPU
+    TEXT_EXTRACTION_WORKERS: int = 0
+    # A document still "analyzing" after this long is assumed dead and may be re-queued
+    ANALYSIS_STALE_AFTER: int = 900  # seconds
+
     # === CORS ===
     CORS_ORIGINS: list[str] = ["http://localhost:3000", "http://localhost:8080"]
     CORS_ALLOW_CREDENTIALS: bool = True
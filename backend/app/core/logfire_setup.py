@@ -1,13 +1,26 @@
-
 """Logfire observability configuration."""
 
 import logfire
 
 from app.core.config import settings
 
+# What has been set up in this process. Instrumenting twice (app reloads, test
+# fixtures, workers) would stack a second span around every query and request.
+_instrumented: set[str] = set()
+
+
+def _first_time(name: str) -> bool:
+    """Record name as set up; return False if it already was."""
+    if name in _instrumented:
+        return False
+    _instrumented.add(name)
+    return True
+
 
 def setup_logfire() -> None:
     """Configure Logfire instrumentation."""
+    if not _first_time("configure"):
+        return
     logfire.configure(
         token=settings.LOGFIRE_TOKEN,
         service_name=settings.LOGFIRE_SERVICE_NAME,
@@ -18,14 +31,20 @@ def setup_logfire() -> None:
 
 def instrument_app(app):
     """Instrument FastAPI app with Logfire."""
+    # Tracked per app: each FastAPI instance needs its own instrumentation
+    if getattr(app.state, "logfire_instrumented", False):
+        return
+    app.state.logfire_instrumented = True
     logfire.instrument_fastapi(app)
 
 
 def instrument_asyncpg():
     """Instrument asyncpg for PostgreSQL."""
-    logfire.instrument_asyncpg()
+    if _first_time("asyncpg"):
+        logfire.instrument_asyncpg()
 
 
 def instrument_pydantic_ai():
     """Instrument PydanticAI for AI agent observability."""
-    logfire.instrument_pydantic_ai()
+    if _first_time("pydantic_ai"):
+        logfire.instrument_pydantic_ai()
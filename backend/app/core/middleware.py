@@ -3,30 +3,53 @@
 from typing import ClassVar
 from uuid import uuid4
 
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 
-class RequestIDMiddleware(BaseHTTPMiddleware):
+class RequestIDMiddleware:
     """Middleware that adds a unique request ID to each request.
 
     The request ID is taken from the X-Request-ID header if present,
     otherwise a new UUID is generated. The ID is added to the response
     headers and is available in request.state.request_id.
-    """
-
-    async def dispatch(self, request: Request, call_next) -> Response:
-        """Add request ID to request state and response headers."""
-        request_id = request.headers.get("X-Request-ID", str(uuid4()))
-        request.state.request_id = request_id
 
-        response = await call_next(request)
-        response.headers["X-Request-ID"] = request_id
-        return response
+    Implemented as a pure ASGI middleware, like SecurityHeadersMiddleware.
+    """
 
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
 
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Add request ID to request state and response headers."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        raw_request_id = None
+        for name, value in scope["headers"]:
+            if name == b"x-request-id":
+                raw_request_id = value
+                break
+        if raw_request_id is None:
+            raw_request_id = str(uuid4()).encode("latin-1")
+        # request.state is backed by scope["state"]
+        scope.setdefault("state", {})["request_id"] = raw_request_id.decode("latin-1")
+
+        async def send_with_request_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = [
+                    (name, value)
+                    for name, value in message.get("headers", ())
+                    if name != b"x-request-id"
+                ]
+                headers.append((b"x-request-id", raw_request_id))
+                message["headers"] = headers
+            await send(message)
+
+        await self.app(scope, receive, send_with_request_id)
+
+
+class SecurityHeadersMiddleware:
     """Middleware that adds security headers to all responses.
 
     This includes:
@@ -37,6 +60,10 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
     - Referrer-Policy
     - Permissions-Policy
 
+    Implemented as a pure ASGI middleware: it only rewrites the headers of the
+    http.response.start message, so it avoids the per-request task group and
+    body stream that BaseHTTPMiddleware adds.
+
     Usage:
         app.add_middleware(SecurityHeadersMiddleware)
 
@@ -64,36 +91,53 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
 
     def __init__(
         self,
-        app,
+        app: ASGIApp,
         csp_directives: dict | None = None,
         exclude_paths: set | None = None,
     ):
-        super().__init__(app)
+        self.app = app
         self.csp_directives = csp_directives or self.DEFAULT_CSP_DIRECTIVES
-        self.exclude_paths = exclude_paths or {"/docs", "/redoc", "/openapi.json"}
-
-    async def dispatch(self, request: Request, call_next) -> Response:
-        """Add security headers to the response."""
-        response = await call_next(request)
-
-        # Skip for docs/openapi endpoints which need different CSP
-        if request.url.path in self.exclude_paths:
-            return response
-
-        # Build CSP header
-        csp_value = "; ".join(
+        self.exclude_paths = frozenset(exclude_paths or {"/docs", "/redoc", "/openapi.json"})
+        # csp_directives don't change after init, so the header values are built once
+        self._csp_value = "; ".join(
             f"{directive} {value}" for directive, value in self.csp_directives.items()
         )
-
-        # Add security headers
-        response.headers["Content-Security-Policy"] = csp_value
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        response.headers["X-Frame-Options"] = "DENY"
-        response.headers["X-XSS-Protection"] = "1; mode=block"
-        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
-        response.headers["Permissions-Policy"] = (
-            "accelerometer=(), camera=(), geolocation=(), gyroscope=(), "
-            "magnetometer=(), microphone=(), payment=(), usb=()"
+        self._static_headers = (
+            ("Content-Security-Policy", self._csp_value),
+            ("X-Content-Type-Options", "nosniff"),
+            ("X-Frame-Options", "DENY"),
+            ("X-XSS-Protection", "1; mode=block"),
+            ("Referrer-Policy", "strict-origin-when-cross-origin"),
+            (
+                "Permissions-Policy",
+                "accelerometer=(), camera=(), geolocation=(), gyroscope=(), "
+                "magnetometer=(), microphone=(), payment=(), usb=()",
+            ),
         )
-
-        return response
+        # ASGI header names are lowercase bytes
+        self._raw_headers = [
+            (name.lower().encode("latin-1"), value.encode("latin-1"))
+            for name, value in self._static_headers
+        ]
+        self._raw_names = frozenset(name for name, _ in self._raw_headers)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Add security headers to the response."""
+        # Skip for docs/openapi endpoints which need different CSP
+        if scope["type"] != "http" or scope["path"] in self.exclude_paths:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Our values replace any the endpoint set itself
+                headers = [
+                    (name, value)
+                    for name, value in message.get("headers", ())
+                    if name not in self._raw_names
+                ]
+                headers.extend(self._raw_headers)
+                message["headers"] = headers
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
@@ -0,0 +1,74 @@
+"""Keyset (cursor) pagination.
+
+Pages are ordered newest first by (created_at, id) and each page continues
+from the last row of the previous one, so fetching a deep page costs the same
+as the first - unlike OFFSET, which scans and discards every skipped row.
+"""
+
+import base64
+from datetime import datetime
+from typing import Any, TypeVar
+from uuid import UUID
+
+from sqlalchemy import Select, func, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.exceptions import BadRequestError
+
+T = TypeVar("T")
+
+# Total row counts per table; a full COUNT(*) per page request is too expensive
+_count_cache: TTLCache[str, int] = TTLCache(maxsize=64, ttl=settings.PAGINATION_COUNT_CACHE_TTL)
+
+
+def encode_cursor(created_at: datetime, id: UUID) -> str:
+    """Encode the sort key of a row as an opaque cursor."""
+    return base64.urlsafe_b64encode(f"{created_at.isoformat()}|{id}".encode()).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """Decode a cursor created by encode_cursor.
+
+    Raises:
+        BadRequestError: If the cursor is malformed.
+    """
+    try:
+        created_at, id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(created_at), UUID(id)
+    except ValueError as e:
+        raise BadRequestError(
+            message="Invalid pagination cursor",
+            details={"cursor": cursor},
+        ) from e
+
+
+def keyset_page_query(query: Select, model: Any, cursor: str | None, size: int) -> Select:
+    """Restrict a query to the page after cursor.
+
+    One extra row is fetched so split_page can tell whether another page follows.
+    The model must have created_at and id columns.
+    """
+    if cursor is not None:
+        query = query.where(tuple_(model.created_at, model.id) < decode_cursor(cursor))
+    return query.order_by(model.created_at.desc(), model.id.desc()).limit(size + 1)
+
+
+def split_page(rows: list[T], size: int) -> tuple[list[T], str | None]:
+    """Split rows fetched by keyset_page_query into the page and the next cursor."""
+    if len(rows) <= size:
+        return rows, None
+    rows = rows[:size]
+    last: Any = rows[-1]
+    return rows, encode_cursor(last.created_at, last.id)
+
+
+async def cached_count(db: AsyncSession, model: Any) -> int:
+    """Count the rows of a model's table, cached for PAGINATION_COUNT_CACHE_TTL."""
+    key = model.__tablename__
+    total = _count_cache.get(key)
+    if total is None:
+        total = await db.scalar(select(func.count()).select_from(model)) or 0
+        _count_cache.set(key, total)
+    return total
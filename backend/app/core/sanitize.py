@@ -12,6 +12,7 @@ import html
 import os
 import re
 import unicodedata
+from functools import lru_cache
 from pathlib import Path
 from typing import TypeVar
 
@@ -28,6 +29,18 @@ DEFAULT_ALLOWED_ATTRIBUTES = {
     "acronym": frozenset({"title"}),
 }
 
+# Compiled once; these run on every sanitized value
+_UNSAFE_FILENAME_CHARS = re.compile(r"[/\\:*?\"<>|]")
+_FILENAME_SEPARATORS = re.compile(r"[\s_]+")
+_CONTROL_CHARS = {
+    # allow_newlines -> control characters to strip
+    True: re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]"),
+    False: re.compile(r"[\x00-\x1f\x7f]"),
+}
+
+# escape_sql_like with the default backslash escape, done in a single pass
+_LIKE_ESCAPES = str.maketrans({"\\": "\\\\", "%": "\\%", "_": "\\_"})
+
 
 def sanitize_html(
     content: str,
@@ -76,10 +89,10 @@ def sanitize_filename(filename: str, allow_unicode: bool = False) -> str:
     if not filename:
         return ""
 
-    # Normalize unicode
+    # Normalize unicode (pure-ASCII names, the common case, need no normalization)
     if allow_unicode:
         filename = unicodedata.normalize("NFKC", filename)
-    else:
+    elif not filename.isascii():
         filename = (
             unicodedata.normalize("NFKD", filename)
             .encode("ascii", "ignore")
@@ -93,10 +106,10 @@ def sanitize_filename(filename: str, allow_unicode: bool = False) -> str:
     filename = filename.replace("\x00", "")
 
     # Replace path separators and special characters
-    filename = re.sub(r"[/\\:*?\"<>|]", "_", filename)
+    filename = _UNSAFE_FILENAME_CHARS.sub("_", filename)
 
     # Replace multiple underscores/spaces with single underscore
-    filename = re.sub(r"[\s_]+", "_", filename)
+    filename = _FILENAME_SEPARATORS.sub("_", filename)
 
     # Remove leading/trailing underscores and dots
     filename = filename.strip("._")
@@ -108,6 +121,16 @@ def sanitize_filename(filename: str, allow_unicode: bool = False) -> str:
     return filename
 
 
+@lru_cache(maxsize=32)
+def _resolve_base(base_dir: str) -> Path:
+    """Resolve a base directory once per process.
+
+    Base directories come from configuration, not user input, so the result
+    is cached until restart; resolve() costs a stat/readlink per component.
+    """
+    return Path(base_dir).resolve()
+
+
 def validate_safe_path(
     base_dir: Path | str,
     user_path: str,
@@ -133,7 +156,7 @@ def validate_safe_path(
         >>> validate_safe_path("/uploads", "images/photo.jpg")
         Path("/uploads/images/photo.jpg")
     """
-    base_path = Path(base_dir).resolve()
+    base_path = _resolve_base(str(base_dir))
     user_path_sanitized = sanitize_filename(user_path.lstrip("/\\"))
 
     # Resolve the full path
@@ -171,10 +194,7 @@ def sanitize_string(
         return ""
 
     # Strip null bytes and other control characters (except newlines if allowed)
-    if allow_newlines:
-        value = re.sub(r"[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]", "", value)
-    else:
-        value = re.sub(r"[\x00-\x1f\x7f]", "", value)
+    value = _CONTROL_CHARS[bool(allow_newlines)].sub("", value)
 
     # Strip whitespace if requested
     if strip_whitespace:
@@ -233,17 +253,21 @@ def sanitize_numeric(
         >>> sanitize_numeric("abc", int, default=0)
         0
     """
-    try:
-        result = value_type(value)
+    if isinstance(value, value_type) and not isinstance(value, bool):
+        # Already the right type: no conversion, and no exception to guard against
+        result = value
+    else:
+        try:
+            result = value_type(value)
+        except (ValueError, TypeError):
+            return default
 
-        if min_value is not None and result < min_value:
-            result = min_value
-        if max_value is not None and result > max_value:
-            result = max_value
+    if min_value is not None and result < min_value:
+        result = min_value
+    if max_value is not None and result > max_value:
+        result = max_value
 
-        return result
-    except (ValueError, TypeError):
-        return default
+    return result
 
 
 def escape_sql_like(pattern: str, escape_char: str = "\\") -> str:
@@ -264,6 +288,9 @@ def escape_sql_like(pattern: str, escape_char: str = "\\") -> str:
         >>> escape_sql_like("under_score")
         "under\\_score"
     """
+    if escape_char == "\\":
+        return pattern.translate(_LIKE_ESCAPES)
+
     # Escape the escape character first, then special chars
     pattern = pattern.replace(escape_char, escape_char + escape_char)
     pattern = pattern.replace("%", escape_char + "%")
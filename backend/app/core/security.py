@@ -9,6 +9,11 @@ import jwt
 
 from app.core.config import settings
 
+# Settings are fixed for the life of the process, so the key is encoded once
+_SECRET_KEY = settings.SECRET_KEY.encode("utf-8")
+_ALGORITHM = settings.ALGORITHM
+_ALGORITHMS = [_ALGORITHM]
+
 
 def create_access_token(
     subject: str | Any,
@@ -23,7 +28,7 @@ def create_access_token(
         )
 
     to_encode = {"exp": expire, "sub": str(subject), "type": "access"}
-    return jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+    return jwt.encode(to_encode, _SECRET_KEY, algorithm=_ALGORITHM)
 
 
 def create_refresh_token(
@@ -39,7 +44,7 @@ def create_refresh_token(
         )
 
     to_encode = {"exp": expire, "sub": str(subject), "type": "refresh"}
-    return jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+    return jwt.encode(to_encode, _SECRET_KEY, algorithm=_ALGORITHM)
 
 
 def verify_token(token: str) -> dict[str, Any] | None:
@@ -47,8 +52,8 @@ def verify_token(token: str) -> dict[str, Any] | None:
     try:
         payload = jwt.decode(
             token,
-            settings.SECRET_KEY,
-            algorithms=[settings.ALGORITHM],
+            _SECRET_KEY,
+            algorithms=_ALGORITHMS,
         )
         return payload
     except jwt.PyJWTError:
@@ -63,9 +68,13 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     )
 
 
-def get_password_hash(password: str) -> str:
-    """Hash a password."""
+def get_password_hash(password: str, rounds: int | None = None) -> str:
+    """Hash a password.
+
+    rounds overrides the bcrypt cost (BCRYPT_ROUNDS). Only lower it for
+    throwaway data such as development seeds.
+    """
     return bcrypt.hashpw(
         password.encode("utf-8"),
-        bcrypt.gensalt(),
+        bcrypt.gensalt(rounds=rounds or settings.BCRYPT_ROUNDS),
     ).decode("utf-8")
@@ -1,7 +1,11 @@
 
 """SQLAlchemy base model."""
 
+import os
+import time
+import uuid
 from datetime import datetime
+from typing import Any, ClassVar
 
 from sqlalchemy import DateTime, MetaData, func
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
@@ -17,6 +21,20 @@ NAMING_CONVENTION = {
 }
 
 
+
+def uuid7() -> uuid.UUID:
+    """Generate a time-ordered UUID (RFC 9562 version 7).
+
+    Used for primary keys instead of uuid4: new keys sort after existing ones,
+    so inserts append to the right edge of the primary key index rather than
+    splitting random pages all over it.
+    """
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10))
+    value = value & ~(0xF << 76) | 0x7 << 76  # version 7
+    value = value & ~(0x3 << 62) | 0x2 << 62  # RFC 4122 variant
+    return uuid.UUID(int=value)
+
+
 class Base(DeclarativeBase):
     """Base class for all SQLAlchemy models."""
 
@@ -24,7 +42,13 @@ class Base(DeclarativeBase):
 
 
 class TimestampMixin:
-    """Mixin for created_at and updated_at timestamps."""
+    """Mixin for created_at and updated_at timestamps.
+
+    eager_defaults makes UPDATEs return the new updated_at (and INSERTs the
+    new created_at) via RETURNING, so flushed objects never need a refresh.
+    """
+
+    __mapper_args__: ClassVar[dict[str, Any]] = {"eager_defaults": True}
 
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
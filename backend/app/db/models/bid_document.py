@@ -1,26 +1,39 @@
 """Bid document model."""
 
 from datetime import datetime
-from uuid import UUID, uuid4
+from uuid import UUID
 
-from sqlalchemy import DateTime, ForeignKey, String, Text, func, JSON
+from sqlalchemy import DateTime, ForeignKey, Index, String, Text, func, text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.db.base import Base
+from app.db.base import Base, uuid7
 
 
 class BidDocument(Base):
     """Bid document model for storing uploaded bid files."""
 
     __tablename__ = "bid_documents"
+    __table_args__ = (
+        # Serves containment queries on the analysis (analysis_result @> '{...}');
+        # jsonb_path_ops is smaller and faster than the default operator class for @>
+        Index(
+            "bid_documents_analysis_result_idx",
+            "analysis_result",
+            postgresql_using="gin",
+            postgresql_ops={"analysis_result": "jsonb_path_ops"},
+        ),
+        # Matches get_list_by_user (a user's documents, newest first), so the list
+        # is read in index order with no sort; also serves plain user_id lookups
+        Index("bid_documents_user_id_uploaded_at_idx", "user_id", text("uploaded_at DESC")),
+    )
 
     # Primary key
     id: Mapped[UUID] = mapped_column(
         PG_UUID(as_uuid=True),
         primary_key=True,
-        default=uuid4,
-        index=True,
+        default=uuid7,
     )
 
     # File information
@@ -30,16 +43,28 @@ class BidDocument(Base):
     file_size: Mapped[int] = mapped_column(nullable=False)  # in bytes
     file_type: Mapped[str] = mapped_column(String(100), nullable=False)  # mime type
 
-    # Extracted content
-    content_text: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # Extracted content - can be megabytes, so it is only selected by queries
+    # that undefer() it; reading it on any other loaded document raises
+    content_text: Mapped[str | None] = mapped_column(
+        Text,
+        nullable=True,
+        deferred=True,
+        deferred_raiseload=True,
+    )
 
     # Analysis results
-    analysis_result: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+    analysis_result: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
     analysis_status: Mapped[str] = mapped_column(
         String(50),
         default="pending",
         nullable=False,
     )  # pending, analyzing, completed, failed
+    # OpenAI Batch API job the document was submitted with (batch analysis only)
+    analysis_batch_id: Mapped[str | None] = mapped_column(
+        String(100),
+        nullable=True,
+        index=True,
+    )
 
     # Metadata
     project_name: Mapped[str | None] = mapped_column(String(255), nullable=True)
@@ -55,13 +80,17 @@ class BidDocument(Base):
         DateTime(timezone=True),
         nullable=True,
     )
+    # When the document last entered "analyzing"; lets a run that died be re-queued
+    analysis_started_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+    )
 
     # Relationships
     user_id: Mapped[UUID] = mapped_column(
         PG_UUID(as_uuid=True),
         ForeignKey("users.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
 
     def __repr__(self) -> str:
@@ -3,11 +3,11 @@
 
 import uuid
 
-from sqlalchemy import String, Text
+from sqlalchemy import Index, String, Text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
-from app.db.base import Base, TimestampMixin
+from app.db.base import Base, TimestampMixin, uuid7
 
 
 class Item(Base, TimestampMixin):
@@ -18,9 +18,11 @@ class Item(Base, TimestampMixin):
     """
 
     __tablename__ = "items"
+    # Supports keyset pagination (newest first, see app.core.pagination)
+    __table_args__ = (Index("items_created_at_id_idx", "created_at", "id"),)
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, default=uuid7
     )
     title: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
@@ -4,11 +4,11 @@
 import uuid
 from enum import Enum
 
-from sqlalchemy import Boolean, String
+from sqlalchemy import Boolean, Index, String
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
-from app.db.base import Base, TimestampMixin
+from app.db.base import Base, TimestampMixin, uuid7
 
 
 class UserRole(str, Enum):
@@ -23,13 +23,20 @@ class UserRole(str, Enum):
     USER = "user"
 
 
+# Plain dict lookup; UserRole(value) goes through the Enum metaclass on every call
+_ROLE_BY_VALUE = {role.value: role for role in UserRole}
+_ADMIN = UserRole.ADMIN.value
+
+
 class User(Base, TimestampMixin):
     """User model."""
 
     __tablename__ = "users"
+    # Supports keyset pagination (newest first, see app.core.pagination)
+    __table_args__ = (Index("users_created_at_id_idx", "created_at", "id"),)
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, default=uuid7
     )
     email: Mapped[str] = mapped_column(String(255), unique=True, index=True, nullable=False)
     hashed_password: Mapped[str | None] = mapped_column(String(255), nullable=True)
@@ -41,16 +48,16 @@ class User(Base, TimestampMixin):
     @property
     def user_role(self) -> UserRole:
         """Get role as enum."""
-        return UserRole(self.role)
+        return _ROLE_BY_VALUE[self.role]
 
     def has_role(self, required_role: UserRole) -> bool:
         """Check if user has the required role or higher.
 
-        Admin role has access to everything.
+        Admin role has access to everything. The role is stored on the user row
+        itself, so this never triggers a relationship load.
         """
-        if self.role == UserRole.ADMIN.value:
-            return True
-        return self.role == required_role.value
+        # UserRole is a str enum, so members compare equal to their stored values
+        return self.role == _ADMIN or self.role == required_role
 
     def __repr__(self) -> str:
         return f"<User(id={self.id}, email={self.email}, role={self.role})>"
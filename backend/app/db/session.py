@@ -1,19 +1,38 @@
 
 """Async PostgreSQL database session."""
 
+import asyncio
+import logging
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from app.core.config import settings
 
+logger = logging.getLogger(__name__)
+
+# Single engine (and connection pool) per process, shared by every session below
 engine = create_async_engine(
     settings.DATABASE_URL,
     echo=settings.DEBUG,
     pool_size=settings.DB_POOL_SIZE,
     max_overflow=settings.DB_MAX_OVERFLOW,
     pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+    pool_use_lifo=settings.DB_POOL_USE_LIFO,
+    query_cache_size=settings.DB_QUERY_CACHE_SIZE,
+    insertmanyvalues_page_size=settings.DB_INSERTMANYVALUES_PAGE_SIZE,
+    connect_args={
+        # JIT compilation slows down asyncpg's type introspection queries
+        "server_settings": {"jit": "off"},
+        "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+        # SQLAlchemy prepares statements through its own per-connection cache
+        # (default 100 entries), separate from asyncpg's statement_cache_size
+        "prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+    },
 )
 
 async_session_maker = async_sessionmaker(
@@ -42,6 +61,8 @@ async def get_db_context() -> AsyncGenerator[AsyncSession, None]:
     """Get async database session as context manager.
 
     Use this with 'async with' for manual session management (e.g., WebSockets).
+    Sessions come from the same module-level engine as get_db_session, so they
+    reuse pooled connections instead of opening a new one per call.
     """
     async with async_session_maker() as session:
         try:
@@ -52,6 +73,27 @@ async def get_db_context() -> AsyncGenerator[AsyncSession, None]:
             raise
 
 
+async def warm_up_db() -> None:
+    """Open DB_POOL_SIZE connections up front.
+
+    The pool otherwise connects lazily, so the first burst of requests after
+    startup would each pay for a new connection.
+    """
+
+    async def _connect() -> None:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    try:
+        await asyncio.wait_for(
+            asyncio.gather(*(_connect() for _ in range(settings.DB_POOL_SIZE))),
+            timeout=settings.DB_POOL_TIMEOUT,
+        )
+    except Exception as e:
+        # Not fatal: the readiness probe reports the database as unavailable
+        logger.warning(f"Database warm-up failed: {e}")
+
+
 async def close_db() -> None:
     """Close database connections."""
     await engine.dispose()
@@ -1,18 +1,26 @@
 """FastAPI application entry point."""
 
+import logging
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+import orjson
+from fastapi import FastAPI, Response
 from fastapi.responses import ORJSONResponse
-from fastapi_pagination import add_pagination
 
 from app.api.exception_handlers import register_exception_handlers
 from app.api.router import api_router
 from app.core.config import settings
-from app.core.logfire_setup import instrument_app, setup_logfire
+from app.core.logfire_setup import (
+    instrument_app,
+    instrument_asyncpg,
+    instrument_pydantic_ai,
+    setup_logfire,
+)
 from app.core.middleware import RequestIDMiddleware
 
+logger = logging.getLogger(__name__)
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
@@ -23,14 +31,28 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """
     # === Startup ===
     setup_logfire()
-    from app.core.logfire_setup import instrument_asyncpg
     instrument_asyncpg()
-    from app.core.logfire_setup import instrument_pydantic_ai
     instrument_pydantic_ai()
 
+    from app.db.session import warm_up_db
+    await warm_up_db()
+
+    # Build the shared assistant agent up front so the first request doesn't pay for it
+    if settings.OPENAI_API_KEY:
+        from app.agents.assistant import get_agent
+        _ = get_agent().agent
+    else:
+        logger.warning("OPENAI_API_KEY is not configured; AI chat and analysis are unavailable")
+
     yield
 
     # === Shutdown ===
+    from app.services.bid_document import shutdown_extraction_pool
+    shutdown_extraction_pool()
+
+    from app.agents.assistant import close_http_client
+    await close_http_client()
+
     from app.db.session import close_db
     await close_db()
 
@@ -38,47 +60,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 # Environments where API docs should be visible
 SHOW_DOCS_ENVIRONMENTS = ("local", "staging", "development")
 
-
-def create_app() -> FastAPI:
-    """Create and configure the FastAPI application."""
-    # Only show docs in allowed environments (hide in production)
-    show_docs = settings.ENVIRONMENT in SHOW_DOCS_ENVIRONMENTS
-    openapi_url = f"{settings.API_V1_STR}/openapi.json" if show_docs else None
-    docs_url = "/docs" if show_docs else None
-    redoc_url = "/redoc" if show_docs else None
-
-    # OpenAPI tags for better documentation organization
-    openapi_tags = [
-        {
-            "name": "health",
-            "description": "Health check endpoints for monitoring and Kubernetes probes",
-        },
-        {
-            "name": "auth",
-            "description": "Authentication endpoints - login, register, token refresh",
-        },
-        {
-            "name": "users",
-            "description": "User management endpoints",
-        },
-        {
-            "name": "items",
-            "description": "Example CRUD endpoints demonstrating the API pattern",
-        },
-        {
-            "name": "agent",
-            "description": "AI agent WebSocket endpoint for real-time chat",
-        },
-        {
-            "name": "bid_documents",
-            "description": "Bid document upload and analysis endpoints",
-        },
-    ]
-
-    app = FastAPI(
-        title=settings.PROJECT_NAME,
-        summary="FastAPI application with Logfire observability",
-        description="""
+APP_DESCRIPTION = """
 A FastAPI project
 
 ## Features
@@ -91,12 +73,73 @@ A FastAPI project
 
 - [Swagger UI](/docs) - Interactive API documentation
 - [ReDoc](/redoc) - Alternative documentation view
-        """.strip(),
+""".strip()
+
+# OpenAPI tags for better documentation organization
+OPENAPI_TAGS = [
+    {
+        "name": "health",
+        "description": "Health check endpoints for monitoring and Kubernetes probes",
+    },
+    {
+        "name": "auth",
+        "description": "Authentication endpoints - login, register, token refresh",
+    },
+    {
+        "name": "users",
+        "description": "User management endpoints",
+    },
+    {
+        "name": "items",
+        "description": "Example CRUD endpoints demonstrating the API pattern",
+    },
+    {
+        "name": "agent",
+        "description": "AI agent WebSocket endpoint for real-time chat",
+    },
+    {
+        "name": "bid_documents",
+        "description": "Bid document upload and analysis endpoints",
+    },
+]
+
+# GET / only reports settings, so its body is serialized once at import time
+_ROOT_BODY = orjson.dumps(
+    {
+        "name": settings.PROJECT_NAME,
+        "version": "0.1.0",
+        "status": "running",
+        "environment": settings.ENVIRONMENT,
+        "endpoints": {
+            "api_docs": "/docs",
+            "api_redoc": "/redoc",
+            "api_health": f"{settings.API_V1_STR}/health",
+            "api_users": f"{settings.API_V1_STR}/users",
+            "api_items": f"{settings.API_V1_STR}/items",
+            "api_bid_documents": f"{settings.API_V1_STR}/bid-documents",
+        },
+        "message": "欢迎使用投标分析系统！请访问 /docs 查看 API 文档",
+    }
+)
+
+
+def create_app() -> FastAPI:
+    """Create and configure the FastAPI application."""
+    # Only show docs in allowed environments (hide in production)
+    show_docs = settings.ENVIRONMENT in SHOW_DOCS_ENVIRONMENTS
+    openapi_url = f"{settings.API_V1_STR}/openapi.json" if show_docs else None
+    docs_url = "/docs" if show_docs else None
+    redoc_url = "/redoc" if show_docs else None
+
+    app = FastAPI(
+        title=settings.PROJECT_NAME,
+        summary="FastAPI application with Logfire observability",
+        description=APP_DESCRIPTION,
         version="0.1.0",
         openapi_url=openapi_url,
         docs_url=docs_url,
         redoc_url=redoc_url,
-        openapi_tags=openapi_tags,
+        openapi_tags=OPENAPI_TAGS,
         contact={
             "name": "Your Name",
             "email": "your@email.com",
@@ -117,15 +160,16 @@ A FastAPI project
     # Exception handlers
     register_exception_handlers(app)
 
-    # CORS middleware
-    from starlette.middleware.cors import CORSMiddleware
-    app.add_middleware(
-        CORSMiddleware,
-        allow_origins=settings.CORS_ORIGINS,
-        allow_credentials=settings.CORS_ALLOW_CREDENTIALS,
-        allow_methods=settings.CORS_ALLOW_METHODS,
-        allow_headers=settings.CORS_ALLOW_HEADERS,
-    )
+    # CORS middleware (not needed, or imported, when no cross-origin client is allowed)
+    if settings.CORS_ORIGINS:
+        from starlette.middleware.cors import CORSMiddleware
+        app.add_middleware(
+            CORSMiddleware,
+            allow_origins=settings.CORS_ORIGINS,
+            allow_credentials=settings.CORS_ALLOW_CREDENTIALS,
+            allow_methods=settings.CORS_ALLOW_METHODS,
+            allow_headers=settings.CORS_ALLOW_HEADERS,
+        )
 
     # API Version Deprecation (uncomment when deprecating old versions)
     # Example: Mark v1 as deprecated when v2 is ready
@@ -144,28 +188,11 @@ A FastAPI project
     # Include API router
     app.include_router(api_router, prefix=settings.API_V1_STR)
 
-    # Pagination
-    add_pagination(app)
-
     # Root endpoint - Welcome page
     @app.get("/", tags=["root"])
-    async def root():
+    async def root() -> Response:
         """Welcome endpoint showing API information."""
-        return {
-            "name": settings.PROJECT_NAME,
-            "version": "0.1.0",
-            "status": "running",
-            "environment": settings.ENVIRONMENT,
-            "endpoints": {
-                "api_docs": "/docs",
-                "api_redoc": "/redoc",
-                "api_health": f"{settings.API_V1_STR}/health",
-                "api_users": f"{settings.API_V1_STR}/users",
-                "api_items": f"{settings.API_V1_STR}/items",
-                "api_bid_documents": f"{settings.API_V1_STR}/bid-documents",
-            },
-            "message": "欢迎使用投标分析系统！请访问 /docs 查看 API 文档",
-        }
+        return Response(content=_ROOT_BODY, media_type="application/json")
 
     return app
 
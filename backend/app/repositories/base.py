@@ -4,7 +4,7 @@
 from typing import Any, Generic, TypeVar
 
 from pydantic import BaseModel
-from sqlalchemy import select
+from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.db.base import Base
 
@@ -46,12 +46,15 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         *,
         obj_in: CreateSchemaType,
     ) -> ModelType:
-        """Create a new record."""
+        """Create a new record.
+
+        Server-side defaults are fetched by the INSERT itself (RETURNING), so
+        the new object needs no refresh.
+        """
         obj_in_data = obj_in.model_dump()
         db_obj = self.model(**obj_in_data)
         db.add(db_obj)
         await db.flush()
-        await db.refresh(db_obj)
         return db_obj
 
     async def update(
@@ -61,21 +64,23 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         db_obj: ModelType,
         obj_in: UpdateSchemaType | dict[str, Any],
     ) -> ModelType:
-        """Update a record."""
+        """Update a record.
+
+        db_obj is already tracked by the session, so the changes only need a
+        flush. Server-side onupdate values (TimestampMixin.updated_at) come
+        back with the UPDATE itself through eager_defaults.
+        """
         update_data = obj_in if isinstance(obj_in, dict) else obj_in.model_dump(exclude_unset=True)
 
         for field, value in update_data.items():
             setattr(db_obj, field, value)
 
-        db.add(db_obj)
         await db.flush()
-        await db.refresh(db_obj)
         return db_obj
 
     async def delete(self, db: AsyncSession, *, id: Any) -> ModelType | None:
-        """Delete a record."""
-        obj = await self.get(db, id)
-        if obj:
-            await db.delete(obj)
-            await db.flush()
-        return obj
+        """Delete a record and return it, with a single DELETE ... RETURNING."""
+        result = await db.execute(
+            delete(self.model).where(self.model.id == id).returning(self.model)
+        )
+        return result.scalar_one_or_none()
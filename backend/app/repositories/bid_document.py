@@ -1,15 +1,32 @@
 """Bid document repository."""
 
+from collections.abc import Sequence
+from datetime import UTC, datetime
 from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, delete, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload, undefer
+from sqlalchemy.orm.interfaces import ORMOption
 
 from app.db.models.bid_document import BidDocument
 
+# Built once: get_by_id runs on nearly every bid document request
+_GET_BY_ID = (
+    select(BidDocument)
+    .where(BidDocument.id == bindparam("doc_id"))
+    .where(BidDocument.user_id == bindparam("user_id"))
+)
+_GET_BY_ID_WITH_CONTENT = _GET_BY_ID.options(undefer(BidDocument.content_text))
+
 
 class BidDocumentRepository:
-    """Repository for bid document database operations."""
+    """Repository for bid document database operations.
+
+    The update_* methods change the given (already tracked) instance in
+    place, flush and return it. They don't refresh it from the database,
+    because no bid document column has a server-side onupdate value.
+    """
 
     def __init__(self, session: AsyncSession) -> None:
         """Initialize repository with database session.
@@ -57,24 +74,29 @@ class BidDocumentRepository:
             bidder_name=bidder_name,
         )
         self.session.add(doc)
+        # uploaded_at comes back from the INSERT's RETURNING clause; no refresh needed
         await self.session.flush()
-        await self.session.refresh(doc)
         return doc
 
-    async def get_by_id(self, doc_id: Any, user_id: Any) -> BidDocument | None:
+    async def get_by_id(
+        self, doc_id: Any, user_id: Any, *, with_content: bool = False
+    ) -> BidDocument | None:
         """Get a bid document by ID and user ID.
 
+        The extracted content_text is only loaded with with_content=True;
+        otherwise accessing it on the returned document raises.
+
         Args:
             doc_id: Document ID
             user_id: User ID
+            with_content: Also load the extracted content_text
 
         Returns:
             Bid document or None
         """
         result = await self.session.execute(
-            select(BidDocument)
-            .where(BidDocument.id == doc_id)
-            .where(BidDocument.user_id == user_id)
+            _GET_BY_ID_WITH_CONTENT if with_content else _GET_BY_ID,
+            {"doc_id": doc_id, "user_id": user_id},
         )
         return result.scalar_one_or_none()
 
@@ -83,26 +105,100 @@ class BidDocumentRepository:
         user_id: Any,
         skip: int = 0,
         limit: int = 100,
-    ) -> list[BidDocument]:
-        """Get list of bid documents for a user.
+        load: Sequence[ORMOption] = (),
+    ) -> tuple[list[BidDocument], int]:
+        """Get a page of a user's bid documents and their total count.
+
+        The total comes from a COUNT(*) OVER () window in the same statement,
+        so it costs no extra round trip. It is 0 when skip is past the end.
+
+        The extracted content_text is not loaded (it can be megabytes per
+        document and list responses don't include it), and neither is any
+        relationship not requested through load. Accessing them on the
+        returned documents raises instead of lazy loading one row at a time.
 
         Args:
             user_id: User ID
             skip: Number of records to skip
             limit: Maximum number of records to return
+            load: Loader options for relationships to include, e.g. selectinload(...)
 
         Returns:
-            List of bid documents
+            Tuple of (bid documents, total number of the user's documents)
         """
         result = await self.session.execute(
-            select(BidDocument)
+            select(BidDocument, func.count().over().label("total"))
+            .options(*load, raiseload("*"))
             .where(BidDocument.user_id == user_id)
             .order_by(BidDocument.uploaded_at.desc())
             .offset(skip)
             .limit(limit)
         )
+        rows = result.all()
+        return [doc for doc, _ in rows], rows[0].total if rows else 0
+
+    async def get_pending_for_batch(self, limit: int = 100) -> list[BidDocument]:
+        """Get documents waiting for analysis, with their extracted text loaded.
+
+        content_text is None for documents whose text hasn't been extracted yet.
+
+        Args:
+            limit: Maximum number of records to return
+
+        Returns:
+            List of bid documents
+        """
+        result = await self.session.execute(
+            select(BidDocument)
+            .options(undefer(BidDocument.content_text))
+            .where(BidDocument.analysis_status == "pending")
+            .order_by(BidDocument.uploaded_at)
+            .limit(limit)
+        )
+        return list(result.scalars().all())
+
+    async def get_by_batch_id(self, batch_id: str) -> list[BidDocument]:
+        """Get documents submitted with a batch analysis job.
+
+        Args:
+            batch_id: OpenAI batch ID
+
+        Returns:
+            List of bid documents
+        """
+        result = await self.session.execute(
+            select(BidDocument).where(BidDocument.analysis_batch_id == batch_id)
+        )
         return list(result.scalars().all())
 
+    async def get_open_batch_ids(self) -> list[str]:
+        """Get IDs of batch jobs that still have documents awaiting results.
+
+        Returns:
+            List of OpenAI batch IDs
+        """
+        result = await self.session.execute(
+            select(BidDocument.analysis_batch_id)
+            .where(BidDocument.analysis_batch_id.is_not(None))
+            .where(BidDocument.analysis_status == "analyzing")
+            .distinct()
+        )
+        return list(result.scalars().all())
+
+    async def mark_batched(self, docs: list[BidDocument], batch_id: str) -> None:
+        """Mark documents as submitted with a batch analysis job.
+
+        Args:
+            docs: Bid documents included in the batch
+            batch_id: OpenAI batch ID
+        """
+        started_at = datetime.now(UTC)
+        for doc in docs:
+            doc.analysis_batch_id = batch_id
+            doc.analysis_status = "analyzing"
+            doc.analysis_started_at = started_at
+        await self.session.flush()
+
     async def update_content_text(
         self,
         doc: BidDocument,
@@ -118,9 +214,7 @@ class BidDocumentRepository:
             Updated bid document
         """
         doc.content_text = content_text
-        self.session.add(doc)
         await self.session.flush()
-        await self.session.refresh(doc)
         return doc
 
     async def update_analysis(
@@ -139,9 +233,7 @@ class BidDocumentRepository:
         """
         doc.analysis_result = analysis_result
         doc.analysis_status = "completed"
-        self.session.add(doc)
         await self.session.flush()
-        await self.session.refresh(doc)
         return doc
 
     async def update_status(
@@ -151,6 +243,8 @@ class BidDocumentRepository:
     ) -> BidDocument:
         """Update document's analysis status.
 
+        Moving to "analyzing" also records analysis_started_at.
+
         Args:
             doc: Bid document to update
             status: New status (pending, analyzing, completed, failed)
@@ -159,16 +253,28 @@ class BidDocumentRepository:
             Updated bid document
         """
         doc.analysis_status = status
-        self.session.add(doc)
+        if status == "analyzing":
+            doc.analysis_started_at = datetime.now(UTC)
         await self.session.flush()
-        await self.session.refresh(doc)
         return doc
 
-    async def delete(self, doc: BidDocument) -> None:
-        """Delete a bid document.
+    async def delete(self, doc_id: Any, user_id: Any) -> str | None:
+        """Delete a user's bid document with a single DELETE ... RETURNING.
+
+        The ownership check is part of the WHERE clause, so one statement
+        both authorizes and deletes.
 
         Args:
-            doc: Bid document to delete
+            doc_id: Document ID
+            user_id: User ID
+
+        Returns:
+            Path of the deleted document's file, or None if there was no such document
         """
-        await self.session.delete(doc)
-        await self.session.flush()
+        result = await self.session.execute(
+            delete(BidDocument)
+            .where(BidDocument.id == doc_id)
+            .where(BidDocument.user_id == user_id)
+            .returning(BidDocument.file_path)
+        )
+        return result.scalar_one_or_none()
@@ -7,9 +7,11 @@ should be handled by ItemService in app/services/item.py.
 
 from uuid import UUID
 
+from sqlalchemy import delete as sa_delete
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import cached_count, keyset_page_query, split_page
 from app.db.models.item import Item
 
 
@@ -34,6 +36,22 @@ async def get_multi(
     return list(result.scalars().all())
 
 
+async def get_page(
+    db: AsyncSession,
+    *,
+    cursor: str | None = None,
+    size: int = 50,
+) -> tuple[list[Item], str | None]:
+    """Get a page of items, newest first, and the cursor of the next page."""
+    result = await db.execute(keyset_page_query(select(Item), Item, cursor, size))
+    return split_page(list(result.scalars().all()), size)
+
+
+async def count(db: AsyncSession) -> int:
+    """Count all items (cached briefly)."""
+    return await cached_count(db, Item)
+
+
 async def create(
     db: AsyncSession,
     *,
@@ -46,8 +64,8 @@ async def create(
         description=description,
     )
     db.add(item)
+    # created_at comes back from the INSERT's RETURNING clause; no refresh needed
     await db.flush()
-    await db.refresh(item)
     return item
 
 
@@ -61,16 +79,12 @@ async def update(
     for field, value in update_data.items():
         setattr(db_item, field, value)
 
-    db.add(db_item)
+    # Already tracked by the session; updated_at comes back with the UPDATE
     await db.flush()
-    await db.refresh(db_item)
     return db_item
 
 
 async def delete(db: AsyncSession, item_id: UUID) -> Item | None:
-    """Delete an item."""
-    item = await get_by_id(db, item_id)
-    if item:
-        await db.delete(item)
-        await db.flush()
-    return item
+    """Delete an item and return it, with a single DELETE ... RETURNING."""
+    result = await db.execute(sa_delete(Item).where(Item.id == item_id).returning(Item))
+    return result.scalar_one_or_none()
@@ -7,11 +7,17 @@ validation) is handled by UserService in app/services/user.py.
 
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, select
+from sqlalchemy import delete as sa_delete
+from sqlalchemy import update as sa_update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import cached_count, keyset_page_query, split_page
 from app.db.models.user import User
 
+# Built once: runs on every login and registration
+_GET_BY_EMAIL = select(User).where(User.email == bindparam("email"))
+
 
 async def get_by_id(db: AsyncSession, user_id: UUID) -> User | None:
     """Get user by ID."""
@@ -20,7 +26,7 @@ async def get_by_id(db: AsyncSession, user_id: UUID) -> User | None:
 
 async def get_by_email(db: AsyncSession, email: str) -> User | None:
     """Get user by email."""
-    result = await db.execute(select(User).where(User.email == email))
+    result = await db.execute(_GET_BY_EMAIL, {"email": email})
     return result.scalar_one_or_none()
 
 
@@ -35,6 +41,22 @@ async def get_multi(
     return list(result.scalars().all())
 
 
+async def get_page(
+    db: AsyncSession,
+    *,
+    cursor: str | None = None,
+    size: int = 50,
+) -> tuple[list[User], str | None]:
+    """Get a page of users, newest first, and the cursor of the next page."""
+    result = await db.execute(keyset_page_query(select(User), User, cursor, size))
+    return split_page(list(result.scalars().all()), size)
+
+
+async def count(db: AsyncSession) -> int:
+    """Count all users (cached briefly)."""
+    return await cached_count(db, User)
+
+
 async def create(
     db: AsyncSession,
     *,
@@ -58,8 +80,8 @@ async def create(
         role=role,
     )
     db.add(user)
+    # created_at comes back from the INSERT's RETURNING clause; no refresh needed
     await db.flush()
-    await db.refresh(user)
     return user
 
 
@@ -76,16 +98,20 @@ async def update(
     for field, value in update_data.items():
         setattr(db_user, field, value)
 
-    db.add(db_user)
+    # Already tracked by the session; updated_at comes back with the UPDATE
     await db.flush()
-    await db.refresh(db_user)
     return db_user
 
 
+async def update_role_by_email(db: AsyncSession, email: str, role: str) -> User | None:
+    """Set a user's role with a single UPDATE ... RETURNING, without loading them first."""
+    result = await db.execute(
+        sa_update(User).where(User.email == email).values(role=role).returning(User)
+    )
+    return result.scalar_one_or_none()
+
+
 async def delete(db: AsyncSession, user_id: UUID) -> User | None:
-    """Delete a user."""
-    user = await get_by_id(db, user_id)
-    if user:
-        await db.delete(user)
-        await db.flush()
-    return user
+    """Delete a user and return it, with a single DELETE ... RETURNING."""
+    result = await db.execute(sa_delete(User).where(User.id == user_id).returning(User))
+    return result.scalar_one_or_none()
@@ -1,20 +1,21 @@
 """Base Pydantic schemas."""
 
-from datetime import datetime
-from typing import Any
-from zoneinfo import ZoneInfo
+from datetime import UTC, datetime
+from typing import Any, Generic, TypeVar
 
 from pydantic import BaseModel, ConfigDict
 
+T = TypeVar("T")
+
 
 def serialize_datetime(dt: datetime) -> str:
     """Serialize datetime to ISO format with timezone.
 
     Ensures all datetimes have explicit timezone (defaults to UTC).
     """
-    if dt.tzinfo is None:
-        dt = dt.replace(tzinfo=ZoneInfo("UTC"))
-    return dt.isoformat()
+    if dt.tzinfo is not None:
+        return dt.isoformat()
+    return dt.replace(tzinfo=UTC).isoformat()
 
 
 class BaseSchema(BaseModel):
@@ -29,9 +30,7 @@ class BaseSchema(BaseModel):
 
     def serializable_dict(self, **kwargs: Any) -> dict[str, Any]:
         """Return a dict with only JSON-serializable fields."""
-        from fastapi.encoders import jsonable_encoder
-
-        return jsonable_encoder(self.model_dump(**kwargs))
+        return self.model_dump(mode="json", **kwargs)
 
 
 class TimestampSchema(BaseModel):
@@ -41,6 +40,18 @@ class TimestampSchema(BaseModel):
     updated_at: datetime | None = None
 
 
+class CursorPage(BaseModel, Generic[T]):
+    """Keyset-paginated list response.
+
+    Pass next_cursor back as the cursor query parameter to get the next page;
+    it is null on the last page. total may lag by up to a minute.
+    """
+
+    items: list[T]
+    total: int
+    next_cursor: str | None = None
+
+
 class BaseResponse(BaseModel):
     """Standard API response."""
 
@@ -1,15 +1,19 @@
 """Bid document schemas."""
 
 from datetime import datetime
+from typing import Annotated
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints
+
+# Matches the String(255) filename columns on the model
+Filename = Annotated[str, StringConstraints(max_length=255)]
 
 
 class BidDocumentBase(BaseModel):
     """Base bid document schema."""
 
-    original_filename: str = Field(..., description="Original filename of uploaded file")
+    original_filename: Filename = Field(..., description="Original filename of uploaded file")
     file_type: str = Field(..., description="MIME type of the file")
     project_name: str | None = Field(None, description="Project name (optional)")
     bidder_name: str | None = Field(None, description="Bidder name (optional)")
@@ -31,6 +35,8 @@ class BidDocumentUpdate(BaseModel):
 class BidDocumentResponse(BaseModel):
     """Schema for bid document response."""
 
+    model_config = ConfigDict(from_attributes=True)
+
     id: UUID
     filename: str
     original_filename: str
@@ -43,8 +49,15 @@ class BidDocumentResponse(BaseModel):
     uploaded_at: datetime
     analyzed_at: datetime | None
 
-    class Config:
-        from_attributes = True
+
+class BidDocumentStatus(BaseModel):
+    """Schema for bid document analysis status."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID
+    analysis_status: str
+    analyzed_at: datetime | None
 
 
 class BidDocumentAnalysis(BaseModel):
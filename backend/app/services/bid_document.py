@@ -1,15 +1,106 @@
 """Bid document service for file processing and AI analysis."""
 
-import os
+import asyncio
+import logging
+import multiprocessing
+from collections.abc import AsyncIterable
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from uuid import UUID, uuid4
-from datetime import datetime
 
+import anyio
+import orjson
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import settings
 from app.db.models.bid_document import BidDocument
+from app.db.session import get_db_context
 from app.repositories.bid_document import BidDocumentRepository
 
+logger = logging.getLogger(__name__)
+
+# Size of the chunks uploads are read and written in
+UPLOAD_CHUNK_SIZE = 1 << 20
+
+
+def extract_text(file_path: str) -> str:
+    """Extract text content from a document file.
+
+    CPU-bound and side-effect free, so it can run in a worker process.
+
+    Args:
+        file_path: Path of the stored file
+
+    Returns:
+        Extracted text, or a message describing why extraction failed
+    """
+    path = Path(file_path)
+    file_ext = path.suffix.lower()
+
+    content = ""
+
+    if file_ext == ".txt":
+        # Plain text
+        content = path.read_text(encoding="utf-8", errors="ignore")
+
+    elif file_ext in [".pdf"]:
+        # PDF extraction
+        try:
+            # PDFium extracts text in native code; PyPDF2 parsed pages in Python
+            import pypdfium2 as pdfium
+            pdf = pdfium.PdfDocument(str(path))
+            try:
+                for page in pdf:
+                    textpage = page.get_textpage()
+                    text = textpage.get_text_range()
+                    textpage.close()
+                    page.close()
+                    if text:
+                        content += text + "\n"
+            finally:
+                pdf.close()
+        except Exception as e:
+            content = f"PDF 提取失败: {str(e)}"
+
+    elif file_ext in [".doc", ".docx"]:
+        # Word document extraction
+        try:
+            if file_ext == ".docx":
+                import docx
+                doc_obj = docx.Document(str(path))
+                for para in doc_obj.paragraphs:
+                    content += para.text + "\n"
+            else:
+                content = "旧版 .doc 文件暂不支持，请转换为 .docx"
+        except Exception as e:
+            content = f"Word 文档提取失败: {str(e)}"
+
+    else:
+        content = f"不支持的文件类型: {file_ext}"
+
+    return content.strip()
+
+
+@lru_cache(maxsize=1)
+def get_extraction_pool() -> ProcessPoolExecutor:
+    """Get the process pool used for text extraction.
+
+    Workers are spawned rather than forked: forking a process that is running
+    an event loop, threads and open DB connections is unsafe.
+    """
+    return ProcessPoolExecutor(
+        max_workers=settings.TEXT_EXTRACTION_WORKERS or None,
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+
+
+def shutdown_extraction_pool() -> None:
+    """Shut down the extraction process pool, if it was created."""
+    if get_extraction_pool.cache_info().currsize:
+        get_extraction_pool().shutdown(cancel_futures=True)
+        get_extraction_pool.cache_clear()
+
 
 class BidDocumentService:
     """Service for bid document operations."""
@@ -28,7 +119,7 @@ class BidDocumentService:
 
     async def upload_file(
         self,
-        file_content: bytes,
+        chunks: AsyncIterable[bytes],
         original_filename: str,
         file_type: str,
         user_id: UUID,
@@ -37,8 +128,11 @@ class BidDocumentService:
     ) -> BidDocument:
         """Upload and store a bid document.
 
+        The file is written to disk chunk by chunk, so memory use stays bounded
+        by the chunk size rather than the file size.
+
         Args:
-            file_content: File content as bytes
+            chunks: File content as an async stream of byte chunks
             original_filename: Original filename
             file_type: MIME type
             user_id: User ID
@@ -53,79 +147,87 @@ class BidDocumentService:
         filename = f"{uuid4()}{file_ext}"
         file_path = self.upload_dir / filename
 
-        # Save file
-        file_path.write_bytes(file_content)
-
-        # Create database record
-        doc = await self.repo.create(
-            user_id=user_id,
-            filename=filename,
-            original_filename=original_filename,
-            file_path=str(file_path),
-            file_size=len(file_content),
-            file_type=file_type,
-            project_name=project_name,
-            bidder_name=bidder_name,
-        )
+        # Save file, then create the database record. If either fails the file
+        # is removed, so no stored file is left without a row pointing to it.
+        file_size = 0
+        try:
+            async with await anyio.open_file(file_path, "wb") as f:
+                async for chunk in chunks:
+                    await f.write(chunk)
+                    file_size += len(chunk)
+
+            doc = await self.repo.create(
+                user_id=user_id,
+                filename=filename,
+                original_filename=original_filename,
+                file_path=str(file_path),
+                file_size=file_size,
+                file_type=file_type,
+                project_name=project_name,
+                bidder_name=bidder_name,
+            )
+        except BaseException:
+            # Shielded so the cleanup still runs when the upload was cancelled
+            with anyio.CancelScope(shield=True):
+                await anyio.Path(file_path).unlink(missing_ok=True)
+            raise
 
         return doc
 
     async def extract_text_from_file(self, doc: BidDocument) -> str:
         """Extract text content from a document file.
 
+        Parsing runs in the extraction process pool, so it doesn't block the
+        event loop.
+
         Args:
             doc: Bid document
 
         Returns:
             Extracted text content
         """
-        file_path = Path(doc.file_path)
-        file_ext = file_path.suffix.lower()
-
-        content = ""
-
         try:
-            if file_ext == ".txt":
-                # Plain text
-                content = file_path.read_text(encoding="utf-8", errors="ignore")
-
-            elif file_ext in [".pdf"]:
-                # PDF extraction
-                try:
-                    import PyPDF2
-                    reader = PyPDF2.PdfReader(str(file_path))
-                    for page in reader.pages:
-                        text = page.extract_text()
-                        if text:
-                            content += text + "\n"
-                except Exception as e:
-                    content = f"PDF 提取失败: {str(e)}"
-
-            elif file_ext in [".doc", ".docx"]:
-                # Word document extraction
-                try:
-                    if file_ext == ".docx":
-                        import docx
-                        doc_obj = docx.Document(str(file_path))
-                        for para in doc_obj.paragraphs:
-                            content += para.text + "\n"
-                    else:
-                        content = "旧版 .doc 文件暂不支持，请转换为 .docx"
-                except Exception as e:
-                    content = f"Word 文档提取失败: {str(e)}"
-
-            else:
-                content = f"不支持的文件类型: {file_ext}"
+            loop = asyncio.get_running_loop()
+            content = await loop.run_in_executor(
+                get_extraction_pool(), extract_text, doc.file_path
+            )
 
             # Update document with extracted text
-            if content.strip():
-                await self.repo.update_content_text(doc, content.strip())
+            if content:
+                await self.repo.update_content_text(doc, content)
 
         except Exception as e:
             content = f"文件读取错误: {str(e)}"
 
         return content.strip()
 
+    async def analyze(self, doc: BidDocument) -> BidDocument:
+        """Extract text if needed and run the AI analysis on a document.
+
+        Args:
+            doc: Bid document
+
+        Returns:
+            Analyzed bid document
+        """
+        from app.agents.bid_analysis import (
+            BidAnalysisDeps,
+            build_analysis_prompt,
+            get_bid_analysis_agent,
+        )
+
+        if not doc.content_text:
+            await self.extract_text_from_file(doc)
+
+        deps = BidAnalysisDeps(
+            document_id=str(doc.id),
+            filename=doc.original_filename,
+        )
+        result = await get_bid_analysis_agent().run(
+            build_analysis_prompt(deps, doc.content_text or ""), deps=deps
+        )
+        return await self.repo.update_analysis(doc, orjson.loads(result.output))
+
     def get_file_path(self, doc: BidDocument) -> Path:
         """Get file path for a document.
 
@@ -137,16 +239,46 @@ class BidDocumentService:
         """
         return Path(doc.file_path)
 
-    async def delete_file(self, doc: BidDocument) -> None:
-        """Delete a document and its file.
+    async def delete(self, doc_id: UUID, user_id: UUID) -> bool:
+        """Delete a user's document and its file.
 
         Args:
-            doc: Bid document
+            doc_id: Document ID
+            user_id: Owner's user ID
+
+        Returns:
+            False if the user has no such document
         """
-        # Delete file from disk
-        file_path = self.get_file_path(doc)
-        if file_path.exists():
-            file_path.unlink()
+        file_path = await self.repo.delete(doc_id, user_id)
+        if file_path is None:
+            return False
 
-        # Delete from database
-        await self.repo.delete(doc)
+        # Delete file from disk, off the event loop
+        await anyio.Path(file_path).unlink(missing_ok=True)
+        return True
+
+
+async def run_analysis(doc_id: UUID, user_id: UUID) -> None:
+    """Analyze a queued document in the background.
+
+    Runs outside the request that queued it, with its own short-lived session,
+    so the HTTP connection isn't held for the duration of the LLM call. The
+    outcome is recorded in the document's analysis_status.
+
+    Args:
+        doc_id: Document ID
+        user_id: Owner's user ID
+    """
+    async with get_db_context() as session:
+        service = BidDocumentService(session)
+        doc = await service.repo.get_by_id(doc_id, user_id, with_content=True)
+        if doc is None:
+            return
+
+        try:
+            await service.analyze(doc)
+        except Exception:
+            logger.exception(f"Analysis failed for bid document {doc_id}")
+            # A failed flush leaves the session unusable until it is rolled back
+            await session.rollback()
+            await service.repo.update_status(doc, "failed")
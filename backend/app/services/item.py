@@ -50,6 +50,23 @@ class ItemService:
             self.db, skip=skip, limit=limit, active_only=active_only
         )
 
+    async def get_page(
+        self,
+        *,
+        cursor: str | None = None,
+        size: int = 50,
+    ) -> tuple[list[Item], str | None]:
+        """Get a page of items and the cursor of the next page.
+
+        Raises:
+            BadRequestError: If the cursor is malformed.
+        """
+        return await item_repo.get_page(self.db, cursor=cursor, size=size)
+
+    async def count(self) -> int:
+        """Count all items."""
+        return await item_repo.count(self.db)
+
     async def create(self, item_in: ItemCreate) -> Item:
         """Create a new item."""
         return await item_repo.create(
@@ -6,11 +6,12 @@ Contains business logic for user operations. Uses UserRepository for database ac
 
 from uuid import UUID
 
+import anyio
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.exceptions import AlreadyExistsError, AuthenticationError, NotFoundError
 from app.core.security import get_password_hash, verify_password
-from app.db.models.user import User
+from app.db.models.user import User, UserRole
 from app.repositories import user_repo
 from app.schemas.user import UserCreate, UserUpdate
 
@@ -48,9 +49,29 @@ class UserService:
         """Get multiple users with pagination."""
         return await user_repo.get_multi(self.db, skip=skip, limit=limit)
 
-    async def register(self, user_in: UserCreate) -> User:
+    async def get_page(
+        self,
+        *,
+        cursor: str | None = None,
+        size: int = 50,
+    ) -> tuple[list[User], str | None]:
+        """Get a page of users and the cursor of the next page.
+
+        Raises:
+            BadRequestError: If the cursor is malformed.
+        """
+        return await user_repo.get_page(self.db, cursor=cursor, size=size)
+
+    async def count(self) -> int:
+        """Count all users."""
+        return await user_repo.count(self.db)
+
+    async def register(self, user_in: UserCreate, *, is_superuser: bool = False) -> User:
         """Register a new user.
 
+        is_superuser is only for trusted callers such as the CLI; it is set in
+        the same INSERT rather than with a follow-up UPDATE.
+
         Raises:
             AlreadyExistsError: If email is already registered.
         """
@@ -61,13 +82,15 @@ class UserService:
                 details={"email": user_in.email},
             )
 
-        hashed_password = get_password_hash(user_in.password)
+        # bcrypt is deliberately slow (and releases the GIL), so hash in a worker thread
+        hashed_password = await anyio.to_thread.run_sync(get_password_hash, user_in.password)
         return await user_repo.create(
             self.db,
             email=user_in.email,
             hashed_password=hashed_password,
             full_name=user_in.full_name,
             role=user_in.role.value,
+            is_superuser=is_superuser,
         )
 
     async def authenticate(self, email: str, password: str) -> User:
@@ -77,12 +100,28 @@ class UserService:
             AuthenticationError: If credentials are invalid or user is inactive.
         """
         user = await user_repo.get_by_email(self.db, email)
-        if not user or not verify_password(password, user.hashed_password):
+        if not user or not await anyio.to_thread.run_sync(
+            verify_password, password, user.hashed_password
+        ):
             raise AuthenticationError(message="Invalid email or password")
         if not user.is_active:
             raise AuthenticationError(message="User account is disabled")
         return user
 
+    async def set_role(self, email: str, role: UserRole) -> User:
+        """Change a user's role.
+
+        Raises:
+            NotFoundError: If user does not exist.
+        """
+        user = await user_repo.update_role_by_email(self.db, email, role.value)
+        if not user:
+            raise NotFoundError(
+                message="User not found",
+                details={"email": email},
+            )
+        return user
+
     async def update(self, user_id: UUID, user_in: UserUpdate) -> User:
         """Update user.
 
@@ -93,7 +132,9 @@ class UserService:
 
         update_data = user_in.model_dump(exclude_unset=True)
         if "password" in update_data:
-            update_data["hashed_password"] = get_password_hash(update_data.pop("password"))
+            update_data["hashed_password"] = await anyio.to_thread.run_sync(
+                get_password_hash, update_data.pop("password")
+            )
 
         return await user_repo.update(self.db, db_user=user, update_data=update_data)
 
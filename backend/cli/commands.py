@@ -149,12 +149,7 @@ def user_create(email: str, password: str, role: str, superuser: bool):
             user_service = UserService(session)
             try:
                 user_in = UserCreate(email=email, password=password, role=UserRole(role))
-                user = await user_service.register(user_in)
-
-                if superuser:
-                    user.is_superuser = True
-                    session.add(user)
-
+                user = await user_service.register(user_in, is_superuser=superuser)
                 await session.commit()
                 return user
             except AlreadyExistsError:
@@ -186,12 +181,8 @@ def user_create_admin(email: str, password: str):
             user_service = UserService(session)
             try:
                 user_in = UserCreate(email=email, password=password, role=UserRole.ADMIN)
-                user = await user_service.register(user_in)
-
                 # Admin users are also superusers
-                user.is_superuser = True
-                session.add(user)
-
+                user = await user_service.register(user_in, is_superuser=True)
                 await session.commit()
                 return user
             except AlreadyExistsError:
@@ -218,9 +209,7 @@ def user_set_role(email: str, role: str):
         async with async_session_maker() as session:
             user_service = UserService(session)
             try:
-                user = await user_service.get_by_email(email)
-                user.role = UserRole(role).value
-                session.add(user)
+                user = await user_service.set_role(email, UserRole(role))
                 await session.commit()
                 return user
             except NotFoundError:
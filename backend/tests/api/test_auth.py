@@ -2,9 +2,10 @@
 # ruff: noqa: I001 - Imports structured for Jinja2 template conditionals
 """Tests for authentication routes."""
 
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from unittest.mock import AsyncMock, MagicMock
-from uuid import uuid4
+from uuid import UUID, uuid4
 
 import pytest
 from httpx import AsyncClient
@@ -15,25 +16,40 @@ from app.core.security import create_access_token, create_refresh_token
 from app.main import app
 
 
+@dataclass(slots=True)
 class MockUser:
     """Mock user for testing."""
 
-    def __init__(
-        self,
-        id=None,
-        email="test@example.com",
-        full_name="Test User",
-        is_active=True,
-        is_superuser=False,
-    ):
-        self.id = id or uuid4()
-        self.email = email
-        self.full_name = full_name
-        self.is_active = is_active
-        self.is_superuser = is_superuser
-        self.hashed_password = "hashed"
-        self.created_at = datetime.now(UTC)
-        self.updated_at = datetime.now(UTC)
+    id: UUID = field(default_factory=uuid4)
+    email: str = "test@example.com"
+    full_name: str = "Test User"
+    is_active: bool = True
+    is_superuser: bool = False
+    hashed_password: str = "hashed"
+    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    updated_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+
+
+class FakeUserService:
+    """User service stand-in whose methods all return the given user.
+
+    Tests that need a failure or call assertions replace a method with an AsyncMock.
+    """
+
+    def __init__(self, user: MockUser) -> None:
+        self.user = user
+
+    async def authenticate(self, email: str, password: str) -> MockUser:
+        return self.user
+
+    async def register(self, user_in) -> MockUser:
+        return self.user
+
+    async def get_by_id(self, user_id) -> MockUser:
+        return self.user
+
+    async def get_by_email(self, email: str) -> MockUser:
+        return self.user
 
 
 @pytest.fixture
@@ -43,19 +59,14 @@ def mock_user() -> MockUser:
 
 
 @pytest.fixture
-def mock_user_service(mock_user: MockUser) -> MagicMock:
-    """Create a mock user service."""
-    service = MagicMock()
-    service.authenticate = AsyncMock(return_value=mock_user)
-    service.register = AsyncMock(return_value=mock_user)
-    service.get_by_id = AsyncMock(return_value=mock_user)
-    service.get_by_email = AsyncMock(return_value=mock_user)
-    return service
+def mock_user_service(mock_user: MockUser) -> FakeUserService:
+    """Create a fake user service."""
+    return FakeUserService(mock_user)
 
 
 @pytest.fixture
 async def client_with_mock_service(
-    mock_user_service: MagicMock,
+    mock_user_service: FakeUserService,
     mock_db_session,
 ) -> AsyncClient:
     """Client with mocked user service."""
@@ -91,7 +102,7 @@ async def test_login_success(client_with_mock_service: AsyncClient):
 @pytest.mark.anyio
 async def test_login_invalid_credentials(
     client_with_mock_service: AsyncClient,
-    mock_user_service: MagicMock,
+    mock_user_service: FakeUserService,
 ):
     """Test login with invalid credentials."""
     from app.core.exceptions import AuthenticationError
@@ -126,7 +137,7 @@ async def test_register_success(client_with_mock_service: AsyncClient):
 @pytest.mark.anyio
 async def test_register_duplicate_email(
     client_with_mock_service: AsyncClient,
-    mock_user_service: MagicMock,
+    mock_user_service: FakeUserService,
 ):
     """Test registration with duplicate email."""
     from app.core.exceptions import AlreadyExistsError
@@ -192,7 +203,7 @@ async def test_refresh_token_wrong_type(
 @pytest.mark.anyio
 async def test_refresh_token_inactive_user(
     client_with_mock_service: AsyncClient,
-    mock_user_service: MagicMock,
+    mock_user_service: FakeUserService,
 ):
     """Test refresh token for inactive user."""
     inactive_user = MockUser(is_active=False)
@@ -210,7 +221,7 @@ async def test_refresh_token_inactive_user(
 async def test_get_current_user(
     client_with_mock_service: AsyncClient,
     mock_user: MockUser,
-    mock_user_service: MagicMock,
+    mock_user_service: FakeUserService,
 ):
     """Test getting current user info."""
     from app.api.deps import get_current_user
@@ -224,3 +235,136 @@ async def test_get_current_user(
     assert response.status_code == 200
     data = response.json()
     assert data["email"] == mock_user.email
+
+
+@pytest.mark.anyio
+async def test_get_current_user_caches_verified_token():
+    """Test a verified token is served from cache without another user lookup."""
+    from app.api.deps import get_current_user, revoke_token
+    from app.db.models.user import User
+
+    user = User(
+        id=uuid4(),
+        email="cached@example.com",
+        hashed_password="hashed",
+        full_name="Cached User",
+        is_active=True,
+        is_superuser=False,
+        role="user",
+    )
+    user_service = MagicMock()
+    user_service.get_by_id = AsyncMock(return_value=user)
+    db = MagicMock()
+    db.merge = AsyncMock(side_effect=lambda obj, load: obj)
+    token = create_access_token(subject=str(user.id))
+
+    first = await get_current_user(token, user_service, db)
+    second = await get_current_user(token, user_service, db)
+
+    assert first is user
+    assert second.id == user.id
+    assert second.email == user.email
+    user_service.get_by_id.assert_called_once()
+    db.merge.assert_called_once()
+
+    revoke_token(token)
+    await get_current_user(token, user_service, db)
+    assert user_service.get_by_id.call_count == 2
+    revoke_token(token)
+
+
+@pytest.mark.anyio
+async def test_websocket_auth_returns_a_copy_per_call():
+    """Test WebSocket connections sharing a token never share the cached user object."""
+    from app.api.deps import _auth_cache, _token_cache_key, get_current_user_ws, revoke_token
+    from app.db.models.user import User
+
+    user = User(
+        id=uuid4(),
+        email="ws@example.com",
+        hashed_password="hashed",
+        is_active=True,
+        is_superuser=False,
+        role="user",
+    )
+    token = create_access_token(subject=str(user.id))
+    _auth_cache.set(_token_cache_key(token), user)
+    websocket = MagicMock()
+
+    try:
+        first = await get_current_user_ws(websocket, token=token, access_token=None)
+        second = await get_current_user_ws(websocket, token=token, access_token=None)
+    finally:
+        revoke_token(token)
+
+    assert first is not second
+    assert user not in (first, second)
+    assert first.id == second.id == user.id
+    first.full_name = "Changed"
+    assert second.full_name is None
+    assert user.full_name is None
+
+
+@pytest.mark.anyio
+async def test_invalidate_user_drops_cached_tokens():
+    """Test invalidating a user forces the next request to reload them."""
+    from app.api.deps import get_current_user, invalidate_user
+    from app.db.models.user import User
+
+    user = User(
+        id=uuid4(),
+        email="stale@example.com",
+        hashed_password="hashed",
+        is_active=True,
+        is_superuser=False,
+        role="user",
+    )
+    user_service = MagicMock()
+    user_service.get_by_id = AsyncMock(return_value=user)
+    db = MagicMock()
+    db.merge = AsyncMock(side_effect=lambda obj, load: obj)
+    token = create_access_token(subject=str(user.id))
+
+    await get_current_user(token, user_service, db)
+    invalidate_user(user.id)
+    await get_current_user(token, user_service, db)
+
+    assert user_service.get_by_id.call_count == 2
+    invalidate_user(user.id)
+
+
+@pytest.mark.anyio
+async def test_non_uuid_subject_is_rejected(client_with_mock_service: AsyncClient):
+    """Test a token whose sub is not a UUID is an auth error, not a server error."""
+    access_token = create_access_token(subject="not-a-uuid")
+    response = await client_with_mock_service.get(
+        f"{settings.API_V1_STR}/auth/me",
+        headers={"Authorization": f"Bearer {access_token}"},
+    )
+    assert response.status_code == 401
+
+    response = await client_with_mock_service.post(
+        f"{settings.API_V1_STR}/auth/refresh",
+        json={"refresh_token": create_refresh_token(subject="not-a-uuid")},
+    )
+    assert response.status_code == 401
+
+
+@pytest.mark.anyio
+async def test_token_of_deleted_user_is_rejected(
+    client_with_mock_service: AsyncClient,
+    mock_user_service: FakeUserService,
+):
+    """Test a valid token for a user that no longer exists is an auth error."""
+    from app.core.exceptions import NotFoundError
+
+    mock_user_service.get_by_id = AsyncMock(side_effect=NotFoundError(message="User not found"))
+    access_token = create_access_token(subject=str(uuid4()))
+
+    response = await client_with_mock_service.get(
+        f"{settings.API_V1_STR}/auth/me",
+        headers={"Authorization": f"Bearer {access_token}"},
+    )
+    assert response.status_code == 401
+    mock_user_service.get_by_id.assert_called_once()
+    assert isinstance(mock_user_service.get_by_id.call_args.args[0], UUID)
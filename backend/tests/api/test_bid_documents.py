@@ -0,0 +1,130 @@
+"""Tests for bid document routes."""
+
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from httpx import AsyncClient
+
+from app.core.config import settings
+from app.main import app
+
+
+class MockBidDocument:
+    """Mock bid document for testing."""
+
+    def __init__(self, id=None, original_filename="bid.pdf"):
+        self.id = id or uuid4()
+        self.filename = f"{self.id}.pdf"
+        self.original_filename = original_filename
+        self.file_path = f"uploads/{self.filename}"
+        self.file_size = 1024
+        self.file_type = "application/pdf"
+        self.project_name = None
+        self.bidder_name = None
+        self.analysis_status = "pending"
+        self.analysis_result = None
+        self.uploaded_at = datetime.now(UTC)
+        self.analyzed_at = None
+        self.analysis_started_at = None
+
+
+@pytest.fixture
+def mock_docs() -> list[MockBidDocument]:
+    """Create mock bid documents."""
+    return [MockBidDocument(original_filename=f"bid{i}.pdf") for i in range(3)]
+
+
+@pytest.fixture
+def mock_repo(mock_docs: list[MockBidDocument]) -> MagicMock:
+    """Create a mock bid document repository."""
+    repo = MagicMock()
+    repo.get_by_id = AsyncMock(return_value=mock_docs[0])
+    repo.get_list_by_user = AsyncMock(return_value=(mock_docs, 10))
+    repo.update_status = AsyncMock()
+    return repo
+
+
+@pytest.fixture
+async def client_with_mock_repo(mock_repo: MagicMock, mock_db_session) -> AsyncClient:
+    """Client with an authenticated user and mocked bid document repository."""
+    from httpx import ASGITransport
+
+    from app.api.deps import get_bid_document_repository, get_current_user
+    from app.db.session import get_db_session
+
+    app.dependency_overrides[get_bid_document_repository] = lambda: mock_repo
+    app.dependency_overrides[get_current_user] = lambda: SimpleNamespace(id=uuid4())
+    app.dependency_overrides[get_db_session] = lambda: mock_db_session
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app),
+        base_url="http://test",
+    ) as ac:
+        yield ac
+
+    app.dependency_overrides.clear()
+
+
+@pytest.mark.anyio
+async def test_list_bid_documents(
+    client_with_mock_repo: AsyncClient,
+    mock_docs: list[MockBidDocument],
+):
+    """Test listing documents returns the page and the total count header."""
+    response = await client_with_mock_repo.get(f"{settings.API_V1_STR}/bid-documents")
+    assert response.status_code == 200
+    assert [doc["original_filename"] for doc in response.json()] == [
+        doc.original_filename for doc in mock_docs
+    ]
+    assert response.headers["X-Total-Count"] == "10"
+
+
+@pytest.mark.anyio
+async def test_get_bid_document_not_found(
+    client_with_mock_repo: AsyncClient,
+    mock_repo: MagicMock,
+):
+    """Test getting another user's or a missing document returns 404."""
+    mock_repo.get_by_id = AsyncMock(return_value=None)
+
+    response = await client_with_mock_repo.get(
+        f"{settings.API_V1_STR}/bid-documents/{uuid4()}"
+    )
+    assert response.status_code == 404
+
+
+@pytest.mark.anyio
+async def test_bid_documents_require_authentication(client: AsyncClient):
+    """Test bid document routes reject unauthenticated requests."""
+    response = await client.get(f"{settings.API_V1_STR}/bid-documents")
+    assert response.status_code == 401
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(("started_ago", "expected_status"), [(60, 409), (3600, 202)])
+async def test_analyze_requeues_only_stale_runs(
+    client_with_mock_repo: AsyncClient,
+    mock_repo: MagicMock,
+    mock_docs: list[MockBidDocument],
+    started_ago: int,
+    expected_status: int,
+):
+    """Test a running analysis blocks re-queueing until it is stale."""
+    doc = mock_docs[0]
+    doc.analysis_status = "analyzing"
+    doc.analysis_started_at = datetime.now(UTC) - timedelta(seconds=started_ago)
+
+    with (
+        patch.object(settings, "OPENAI_API_KEY", "test-key"),
+        patch.object(settings, "ANALYSIS_STALE_AFTER", 900),
+        patch("app.api.routes.v1.bid_documents.run_analysis", AsyncMock()) as run_analysis,
+    ):
+        response = await client_with_mock_repo.post(
+            f"{settings.API_V1_STR}/bid-documents/{doc.id}/analyze"
+        )
+
+    assert response.status_code == expected_status
+    assert run_analysis.called == (expected_status == 202)
@@ -17,6 +17,16 @@ async def test_health_check(client: AsyncClient):
     assert data["status"] == "healthy"
 
 
+@pytest.mark.anyio
+async def test_database_pool_status(client: AsyncClient):
+    """Test pool usage is reported without a database round trip."""
+    response = await client.get(f"{settings.API_V1_STR}/health/db")
+    assert response.status_code == 200
+    details = response.json()["details"]
+    assert details["pool_size"] == settings.DB_POOL_SIZE
+    assert details["checked_out"] >= 0
+
+
 @pytest.mark.anyio
 async def test_readiness_check(client: AsyncClient):
     """Test readiness probe with mocked dependencies."""
@@ -56,6 +56,8 @@ def mock_item_service(mock_item: MockItem, mock_items: list[MockItem]) -> MagicM
     service = MagicMock()
     service.get_by_id = AsyncMock(return_value=mock_item)
     service.get_multi = AsyncMock(return_value=mock_items)
+    service.get_page = AsyncMock(return_value=(mock_items, "next-page"))
+    service.count = AsyncMock(return_value=len(mock_items))
     service.create = AsyncMock(return_value=mock_item)
     service.update = AsyncMock(return_value=mock_item)
     service.delete = AsyncMock(return_value=mock_item)
@@ -117,6 +119,24 @@ async def test_create_item_validation_error(client_with_mock_service: AsyncClien
     assert response.status_code == 422
 
 
+@pytest.mark.anyio
+async def test_list_items_cursor_page(
+    client_with_mock_service: AsyncClient,
+    mock_item_service: MagicMock,
+):
+    """Test item listing returns a cursor page."""
+    response = await client_with_mock_service.get(
+        f"{settings.API_V1_STR}/items",
+        params={"cursor": "abc", "size": 3},
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert [item["title"] for item in data["items"]] == ["Item 1", "Item 2", "Item 3"]
+    assert data["total"] == 3
+    assert data["next_cursor"] == "next-page"
+    mock_item_service.get_page.assert_awaited_once_with(cursor="abc", size=3)
+
+
 @pytest.mark.anyio
 async def test_get_item_success(
     client_with_mock_service: AsyncClient,
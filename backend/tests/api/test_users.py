@@ -206,3 +206,100 @@ async def test_delete_user_by_id_not_found(
         f"{settings.API_V1_STR}/users/{uuid4()}"
     )
     assert response.status_code == 404
+
+
+@pytest.fixture
+async def real_auth_client(mock_db_session) -> AsyncClient:
+    """Client that authenticates with real tokens and the auth cache.
+
+    Users live in a dict the mocked user service reads from, so admin changes
+    made through the API are visible to the next lookup.
+    """
+    from app.core.exceptions import NotFoundError
+    from app.db.models.user import User
+
+    now = datetime.now(UTC)
+    admin = User(
+        id=uuid4(), email="admin@example.com", is_active=True, is_superuser=True,
+        role="admin", created_at=now,
+    )
+    target = User(
+        id=uuid4(), email="target@example.com", is_active=True, is_superuser=False,
+        role="user", created_at=now,
+    )
+    users = {admin.id: admin, target.id: target}
+
+    async def get_by_id(user_id):
+        if user_id not in users:
+            raise NotFoundError(message="User not found")
+        return users[user_id]
+
+    async def update(user_id, user_in):
+        user = users[user_id]
+        for field, value in user_in.model_dump(exclude_unset=True).items():
+            setattr(user, field, value)
+        return user
+
+    async def delete(user_id):
+        return users.pop(user_id)
+
+    service = MagicMock()
+    service.get_by_id = AsyncMock(side_effect=get_by_id)
+    service.update = AsyncMock(side_effect=update)
+    service.delete = AsyncMock(side_effect=delete)
+    mock_db_session.merge = AsyncMock(side_effect=lambda obj, load: obj)
+
+    app.dependency_overrides[get_user_service] = lambda: service
+    app.dependency_overrides[get_db_session] = lambda: mock_db_session
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app),
+        base_url="http://test",
+    ) as ac:
+        ac.admin, ac.target = admin, target
+        yield ac
+
+    app.dependency_overrides.clear()
+
+
+def _bearer(user) -> dict[str, str]:
+    from app.core.security import create_access_token
+
+    return {"Authorization": f"Bearer {create_access_token(subject=str(user.id))}"}
+
+
+@pytest.mark.anyio
+async def test_deactivated_user_token_rejected_after_admin_update(real_auth_client: AsyncClient):
+    """Test an admin deactivating a user evicts that user's cached token."""
+    client, target = real_auth_client, real_auth_client.target
+    target_headers = _bearer(target)
+
+    assert (await client.get(f"{settings.API_V1_STR}/users/me", headers=target_headers)).status_code == 200
+
+    response = await client.patch(
+        f"{settings.API_V1_STR}/users/{target.id}",
+        json={"is_active": False},
+        headers=_bearer(client.admin),
+    )
+    assert response.status_code == 200
+
+    response = await client.get(f"{settings.API_V1_STR}/users/me", headers=target_headers)
+    assert response.status_code == 401
+
+
+@pytest.mark.anyio
+async def test_deleted_user_token_rejected_after_admin_delete(real_auth_client: AsyncClient):
+    """Test an admin deleting a user evicts that user's cached token."""
+    client, target = real_auth_client, real_auth_client.target
+    target_headers = _bearer(target)
+
+    assert (await client.get(f"{settings.API_V1_STR}/users/me", headers=target_headers)).status_code == 200
+
+    response = await client.delete(
+        f"{settings.API_V1_STR}/users/{target.id}",
+        headers=_bearer(client.admin),
+    )
+    assert response.status_code == 204
+
+    response = await client.get(f"{settings.API_V1_STR}/users/me", headers=target_headers)
+    assert response.status_code == 401
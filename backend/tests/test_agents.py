@@ -1,14 +1,66 @@
 
 """Tests for AI agent module (PydanticAI)."""
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from pydantic_ai.messages import ModelRequest, ModelResponse
+from pydantic_ai.models.test import TestModel
 
-from app.agents.assistant import AssistantAgent, Deps, get_agent, run_agent
+from app.agents.assistant import (
+    AssistantAgent,
+    Deps,
+    _history_cache,
+    _message_tokens,
+    _response_cache,
+    _summary_cache,
+    build_model_history,
+    get_agent,
+)
 from app.agents.tools.datetime_tool import get_current_datetime
 
 
+def _clear_agent_caches() -> None:
+    _response_cache.clear()
+    _summary_cache.clear()
+    _history_cache.clear()
+    _message_tokens.cache_clear()
+
+
+@pytest.fixture
+def agent_caches():
+    """Run the test with empty module-level agent caches."""
+    _clear_agent_caches()
+    yield
+    _clear_agent_caches()
+
+
+@pytest.fixture
+def count_tokens():
+    """Count tokens with the offline estimate, so tests never download encodings."""
+    with patch(
+        "app.agents.assistant.count_tokens", side_effect=lambda text, model: len(text) // 4
+    ) as mock:
+        yield mock
+
+
+@pytest.fixture
+def assistant(agent_caches, count_tokens) -> AssistantAgent:
+    """AssistantAgent with a mocked model and summarizer.
+
+    The model answers "cached answer" without calling tools; the summarizer
+    answers "earlier chat".
+    """
+    agent = AssistantAgent(temperature=0.0)
+    result = MagicMock(output="cached answer")
+    result.new_messages.return_value = []
+    agent._agent = MagicMock()
+    agent._agent.run = AsyncMock(return_value=result)
+    agent._summarizer = MagicMock()
+    agent._summarizer.run = AsyncMock(return_value=MagicMock(output="earlier chat"))
+    return agent
+
+
 class TestDeps:
     """Tests for Deps dataclass."""
 
@@ -26,6 +78,10 @@ class TestDeps:
         assert deps.user_name == "Test User"
         assert deps.metadata == {"key": "value"}
 
+    def test_deps_uses_slots(self):
+        """Test Deps instances don't carry a per-instance __dict__."""
+        assert not hasattr(Deps(), "__dict__")
+
 
 class TestGetCurrentDatetime:
     """Tests for get_current_datetime tool."""
@@ -63,6 +119,7 @@ class TestAssistantAgent:
     @patch("app.agents.assistant.OpenAIChatModel")
     def test_agent_property_creates_agent(self, mock_model, mock_provider):
         """Test agent property creates agent on first access."""
+        mock_model.return_value = TestModel()
         agent = AssistantAgent()
         _ = agent.agent
         assert agent._agent is not None
@@ -73,6 +130,7 @@ class TestAssistantAgent:
     @patch("app.agents.assistant.OpenAIChatModel")
     def test_agent_property_caches_agent(self, mock_model, mock_provider):
         """Test agent property caches the agent instance."""
+        mock_model.return_value = TestModel()
         agent = AssistantAgent()
         agent1 = agent.agent
         agent2 = agent.agent
@@ -80,6 +138,88 @@ class TestAssistantAgent:
         mock_model.assert_called_once()
 
 
+class TestResponseCache:
+    """Tests for AssistantAgent response caching."""
+
+    @pytest.mark.anyio
+    async def test_low_temperature_run_is_cached(self, assistant):
+        """Test identical low-temperature turns only hit the model once."""
+        first, _, _ = await assistant.run("Hello", [])
+        second, _, _ = await assistant.run("Hello", [])
+
+        assert first == second == "cached answer"
+        assistant._agent.run.assert_called_once()
+
+    @pytest.mark.anyio
+    async def test_high_temperature_run_is_not_cached(self, assistant):
+        """Test sampled (high-temperature) turns always reach the model."""
+        assistant.temperature = 0.9
+
+        await assistant.run("Hello", [])
+        await assistant.run("Hello", [])
+
+        assert assistant._agent.run.call_count == 2
+
+
+class TestHistoryCompaction:
+    """Tests for summarizing long conversation history."""
+
+    @pytest.mark.anyio
+    async def test_short_history_is_unchanged(self, assistant):
+        """Test history under the token budget is sent verbatim."""
+        history = [{"role": "user", "content": "Hello"}] * 20
+
+        assert await assistant._compact_history(history) == history
+        assistant._summarizer.run.assert_not_called()
+
+    @pytest.mark.anyio
+    async def test_long_history_is_summarized_and_cached(self, assistant):
+        """Test old turns are replaced by a cached summary once over budget."""
+        history = [
+            {"role": "user" if i % 2 == 0 else "assistant", "content": f"message {i} " * 400}
+            for i in range(20)
+        ]
+
+        compacted = await assistant._compact_history(history)
+        again = await assistant._compact_history(history)
+
+        assert compacted[0]["role"] == "system"
+        assert "earlier chat" in compacted[0]["content"]
+        assert compacted[-1] == history[-1]
+        assert len(compacted) < len(history)
+        assert again == compacted
+        assistant._summarizer.run.assert_called_once()
+
+    @pytest.mark.anyio
+    async def test_message_tokens_are_counted_once(self, assistant, count_tokens):
+        """Test messages resent on later turns are not re-tokenized."""
+        history = [{"role": "user", "content": f"message {i}"} for i in range(20)]
+
+        await assistant._compact_history(history)
+        await assistant._compact_history([*history, {"role": "user", "content": "new"}])
+
+        assert count_tokens.call_count == 21
+
+
+class TestCountTokens:
+    """Tests for token counting."""
+
+    def test_count_tokens_estimates_when_encoding_cannot_load(self):
+        """Test a failing tiktoken download falls back to the character estimate."""
+        from app.agents import assistant
+
+        if not assistant.HAS_TIKTOKEN:
+            pytest.skip("tiktoken not installed")
+        assistant._get_encoding.cache_clear()
+        try:
+            with patch.object(
+                assistant.tiktoken, "encoding_for_model", side_effect=ConnectionError
+            ):
+                assert assistant.count_tokens("a" * 40, "some-model") == 11
+        finally:
+            assistant._get_encoding.cache_clear()
+
+
 class TestGetAgent:
     """Tests for get_agent factory function."""
 
@@ -88,6 +228,10 @@ class TestGetAgent:
         agent = get_agent()
         assert isinstance(agent, AssistantAgent)
 
+    def test_returns_cached_instance(self):
+        """Test get_agent reuses the same AssistantAgent across calls."""
+        assert get_agent() is get_agent()
+
 
 class TestAgentRoutes:
     """Tests for agent WebSocket routes."""
@@ -99,13 +243,47 @@ class TestAgentRoutes:
         # Actual agent testing would require mocking OpenAI
         pass
 
+    def test_agent_websocket_runs_through_assistant_agent(self, assistant):
+        """Test the WebSocket streams via AssistantAgent, so repeated turns hit its cache."""
+        from fastapi.testclient import TestClient
+        from pydantic_ai import Agent
 
+        from app.core.config import settings
+        from app.main import app
+
+        assistant._agent = Agent[Deps, str](TestModel(custom_output_text="Hello!"))
+
+        def turn(ws) -> list[dict]:
+            ws.send_json({"message": "Hi", "history": []})
+            events = [ws.receive_json()]
+            while events[-1]["type"] not in ("complete", "error"):
+                events.append(ws.receive_json())
+            return events
+
+        with (
+            patch("app.api.routes.v1.agent.get_agent", return_value=assistant),
+            patch.object(
+                assistant, "_compact_history", wraps=assistant._compact_history
+            ) as compact,
+            TestClient(app).websocket_connect(f"{settings.API_V1_STR}/ws/agent") as ws,
+        ):
+            first = turn(ws)
+            second = turn(ws)
+
+        assert "model_request_start" in [event["type"] for event in first]
+        assert "model_request_start" not in [event["type"] for event in second]
+        for events in (first, second):
+            assert {"type": "final_result", "data": {"output": "Hello!"}} in events
+        compact.assert_called_once()
+
+
+@pytest.mark.usefixtures("agent_caches")
 class TestHistoryConversion:
     """Tests for conversation history conversion."""
 
     def test_empty_history(self):
         """Test with empty history."""
-        _agent = AssistantAgent()  # noqa: F841
+        _agent = AssistantAgent()
         # History conversion happens inside run/iter methods
         # We test the structure here
         history = []
@@ -120,3 +298,148 @@ class TestHistoryConversion:
         ]
         assert len(history) == 3
         assert all("role" in msg and "content" in msg for msg in history)
+
+    def test_build_model_history_maps_roles(self):
+        """Test each role is converted to the matching PydanticAI message."""
+        history = [
+            {"role": "user", "content": "Hello"},
+            {"role": "assistant", "content": "Hi there!"},
+            {"role": "system", "content": "You are helpful"},
+            {"role": "unknown", "content": "ignored"},
+        ]
+        messages = build_model_history(history)
+        assert [type(m) for m in messages] == [ModelRequest, ModelResponse, ModelRequest]
+
+    def test_conversation_history_is_extended_incrementally(self):
+        """Test only newly appended messages are converted for a known conversation."""
+        deps = Deps(conversation_id="conv-1")
+        history = [
+            {"role": "user", "content": "Hello"},
+            {"role": "assistant", "content": "Hi there!"},
+        ]
+        first = AssistantAgent._build_model_history(history, deps)
+
+        history.append({"role": "user", "content": "How are you?"})
+        second = AssistantAgent._build_model_history(history, deps)
+
+        assert len(second) == 3
+        assert second[0] is first[0]
+        assert second[1] is first[1]
+
+    def test_conversation_history_rebuilt_when_rewritten(self):
+        """Test the cached prefix is discarded if the client rewrites history."""
+        deps = Deps(conversation_id="conv-2")
+        first = AssistantAgent._build_model_history(
+            [{"role": "user", "content": "Hello"}], deps
+        )
+        second = AssistantAgent._build_model_history(
+            [{"role": "user", "content": "Goodbye"}], deps
+        )
+
+        assert second[0] is not first[0]
+        assert second[0].parts[0].content == "Goodbye"
+
+    def test_conversation_history_rebuilt_when_earlier_message_edited(self):
+        """Test editing a message before the last one also discards the cached prefix."""
+        deps = Deps(conversation_id="conv-3")
+        history = [
+            {"role": "user", "content": "Hello"},
+            {"role": "assistant", "content": "Hi there!"},
+        ]
+        AssistantAgent._build_model_history(history, deps)
+
+        edited = [
+            {"role": "user", "content": "Goodbye"},
+            history[1],
+            {"role": "user", "content": "?"},
+        ]
+        messages = AssistantAgent._build_model_history(edited, deps)
+
+        assert [m.parts[0].content for m in messages] == ["Goodbye", "Hi there!", "?"]
+
+
+class TestBidAnalysisBatch:
+    """Tests for batch bid analysis input."""
+
+    def test_build_batch_input_one_request_per_document(self):
+        """Test each document becomes one chat completion request line."""
+        import json
+        from uuid import uuid4
+
+        from app.agents.bid_analysis_batch import BATCH_ENDPOINT, build_batch_input
+        from app.agents.prompts import BID_ANALYSIS_SYSTEM_PROMPT
+
+        docs = [
+            MagicMock(id=uuid4(), original_filename=f"doc{i}.pdf", content_text=f"text {i}")
+            for i in range(2)
+        ]
+
+        lines = build_batch_input(docs).decode("utf-8").splitlines()
+
+        assert len(lines) == 2
+        request = json.loads(lines[0])
+        assert request["custom_id"] == str(docs[0].id)
+        assert request["url"] == BATCH_ENDPOINT
+        messages = request["body"]["messages"]
+        assert messages[0] == {"role": "system", "content": BID_ANALYSIS_SYSTEM_PROMPT}
+        assert messages[1]["content"][-1]["text"] == "text 0"
+
+
+class TestCoalesceTextDeltas:
+    """Tests for merging streamed text deltas."""
+
+    @staticmethod
+    async def _collect(events, interval=60.0):
+        from app.agents.assistant import coalesce_text_deltas
+
+        async def source():
+            for event in events:
+                yield event
+
+        return [event async for event in coalesce_text_deltas(source(), interval=interval)]
+
+    @pytest.mark.anyio
+    async def test_merges_consecutive_text_deltas(self):
+        """Test text deltas for the same part are merged in order."""
+        from pydantic_ai import PartDeltaEvent, TextPartDelta
+
+        events = [
+            PartDeltaEvent(index=0, delta=TextPartDelta(content_delta=token))
+            for token in ("Hel", "lo", " world")
+        ]
+
+        result = await self._collect(events)
+
+        assert len(result) == 1
+        assert result[0].delta.content_delta == "Hello world"
+
+    @pytest.mark.anyio
+    async def test_other_events_flush_and_pass_through(self):
+        """Test non-text events flush pending text and keep their position."""
+        from pydantic_ai import PartDeltaEvent, TextPartDelta, ToolCallPartDelta
+
+        tool_delta = PartDeltaEvent(index=1, delta=ToolCallPartDelta(args_delta="{}"))
+        events = [
+            PartDeltaEvent(index=0, delta=TextPartDelta(content_delta="a")),
+            tool_delta,
+            PartDeltaEvent(index=2, delta=TextPartDelta(content_delta="b")),
+        ]
+
+        result = await self._collect(events)
+
+        assert [e.delta.content_delta for e in (result[0], result[2])] == ["a", "b"]
+        assert result[1] is tool_delta
+
+    @pytest.mark.anyio
+    async def test_zero_interval_does_not_merge(self):
+        """Test every delta is forwarded when the interval is zero."""
+        from pydantic_ai import PartDeltaEvent, TextPartDelta
+
+        events = [
+            PartDeltaEvent(index=0, delta=TextPartDelta(content_delta=token))
+            for token in ("a", "b")
+        ]
+
+        result = await self._collect(events, interval=0.0)
+
+        assert [e.delta.content_delta for e in result] == ["a", "b"]
@@ -163,3 +163,50 @@ class TestCleanupCommand:
         runner = CliRunner()
         result = runner.invoke(cleanup, ["--dry-run", "--days", "7"])
         assert result.exit_code == 0
+
+
+class TestAnalyzeBatchCommand:
+    """Tests for the analyze-batch command."""
+
+    def test_submit_extracts_text_of_new_uploads(self):
+        """Test pending documents without extracted text get it before submission."""
+        from contextlib import asynccontextmanager
+        from types import SimpleNamespace
+        from unittest.mock import AsyncMock, MagicMock, patch
+
+        from app.commands.analyze_batch import analyze_batch
+        from app.core.config import settings
+        from app.repositories.bid_document import BidDocumentRepository
+        from app.services.bid_document import BidDocumentService
+
+        docs = [SimpleNamespace(content_text=None), SimpleNamespace(content_text="stored")]
+        submitted = []
+
+        async def extract(doc):
+            doc.content_text = "extracted"
+            return doc.content_text
+
+        async def submit(client, batch_docs):
+            submitted.extend(doc.content_text for doc in batch_docs)
+            return "batch_1"
+
+        @asynccontextmanager
+        async def session_maker():
+            yield AsyncMock()
+
+        with (
+            patch.object(settings, "OPENAI_API_KEY", "test-key"),
+            patch("openai.AsyncOpenAI", MagicMock()),
+            patch("app.db.session.async_session_maker", session_maker),
+            patch("app.agents.bid_analysis_batch.submit_batch", submit),
+            patch.object(
+                BidDocumentRepository, "get_pending_for_batch", AsyncMock(return_value=docs)
+            ),
+            patch.object(BidDocumentRepository, "mark_batched", AsyncMock()),
+            patch.object(BidDocumentService, "extract_text_from_file", side_effect=extract),
+        ):
+            result = CliRunner().invoke(analyze_batch, ["--submit"])
+
+        assert result.exit_code == 0, result.output
+        assert submitted == ["extracted", "stored"]
+        assert "Submitted 2 documents" in result.output
@@ -71,6 +71,78 @@ class TestExceptions:
         assert error.code == "VALIDATION_ERROR"
 
 
+class TestUserModel:
+    """Tests for the User model."""
+
+    def test_has_role_without_session(self):
+        """Test role checks work on a detached user (no lazy loading needed)."""
+        from app.db.models.user import User, UserRole
+
+        admin = User(email="admin@example.com", role=UserRole.ADMIN.value)
+        user = User(email="user@example.com", role=UserRole.USER.value)
+
+        assert admin.has_role(UserRole.USER)
+        assert user.has_role(UserRole.USER)
+        assert not user.has_role(UserRole.ADMIN)
+
+
+class TestUuid7:
+    """Tests for time-ordered primary keys."""
+
+    def test_uuid7_is_version_7_and_time_ordered(self):
+        """Test uuid7 sets the version bits and sorts by creation time."""
+        import time
+
+        from app.db.base import uuid7
+
+        first = uuid7()
+        time.sleep(0.002)
+        second = uuid7()
+
+        assert first.version == 7
+        assert str(first.variant) == str(second.variant) == "specified in RFC 4122"
+        assert first < second
+
+
+class TestPagination:
+    """Tests for keyset pagination helpers."""
+
+    def test_cursor_round_trip(self):
+        """Test a cursor decodes to the sort key it was built from."""
+        from datetime import UTC, datetime
+        from uuid import uuid4
+
+        from app.core.pagination import decode_cursor, encode_cursor
+
+        created_at, id = datetime.now(UTC), uuid4()
+        assert decode_cursor(encode_cursor(created_at, id)) == (created_at, id)
+
+    def test_invalid_cursor(self):
+        """Test a malformed cursor is a client error."""
+        import pytest
+
+        from app.core.exceptions import BadRequestError
+        from app.core.pagination import decode_cursor
+
+        with pytest.raises(BadRequestError):
+            decode_cursor("not-a-cursor")
+
+    def test_split_page(self):
+        """Test the extra row becomes the next cursor."""
+        from datetime import UTC, datetime
+        from types import SimpleNamespace
+        from uuid import uuid4
+
+        from app.core.pagination import decode_cursor, split_page
+
+        rows = [SimpleNamespace(created_at=datetime.now(UTC), id=uuid4()) for _ in range(3)]
+
+        page, next_cursor = split_page(rows, 2)
+        assert page == rows[:2]
+        assert decode_cursor(next_cursor) == (rows[1].created_at, rows[1].id)
+        assert split_page(rows, 3) == (rows, None)
+
+
 class TestMiddleware:
     """Tests for middleware."""
 
@@ -80,6 +152,82 @@ class TestMiddleware:
 
         assert RequestIDMiddleware is not None
 
+    def test_request_id_middleware_sets_header_and_state(self):
+        """Test the request ID is echoed or generated, and exposed on request.state."""
+        from fastapi import FastAPI, Request
+        from fastapi.testclient import TestClient
+
+        from app.core.middleware import RequestIDMiddleware
+
+        app = FastAPI()
+        app.add_middleware(RequestIDMiddleware)
+
+        @app.get("/ping")
+        async def ping(request: Request):
+            return {"request_id": request.state.request_id}
+
+        client = TestClient(app)
+        response = client.get("/ping", headers={"X-Request-ID": "abc-123"})
+        assert response.headers["X-Request-ID"] == "abc-123"
+        assert response.json()["request_id"] == "abc-123"
+
+        response = client.get("/ping")
+        assert response.headers["X-Request-ID"] == response.json()["request_id"]
+        assert len(response.headers["X-Request-ID"]) == 36
+
+    def test_security_headers_middleware_adds_headers(self):
+        """Test security headers are added except on excluded paths."""
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+
+        from app.core.middleware import SecurityHeadersMiddleware
+
+        app = FastAPI()
+        app.add_middleware(SecurityHeadersMiddleware)
+
+        @app.get("/ping")
+        async def ping():
+            return {"ok": True}
+
+        client = TestClient(app)
+        response = client.get("/ping")
+        assert response.headers["X-Frame-Options"] == "DENY"
+        assert "default-src 'self'" in response.headers["Content-Security-Policy"]
+        assert "Content-Security-Policy" not in client.get("/docs").headers
+
+    def test_csrf_middleware(self):
+        """Test CSRF middleware sets the cookie and checks the header."""
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+
+        from app.core.csrf import CSRFMiddleware
+
+        app = FastAPI()
+        app.add_middleware(CSRFMiddleware)
+
+        @app.get("/ping")
+        async def ping():
+            return {"ok": True}
+
+        @app.post("/ping")
+        async def post_ping():
+            return {"ok": True}
+
+        client = TestClient(app, base_url="https://test")
+        token = client.get("/ping").cookies["csrf_token"]
+        assert client.post("/ping").json()["detail"] == "CSRF token missing"
+        assert client.post("/ping", headers={"X-CSRF-Token": "wrong"}).status_code == 403
+        assert client.post("/ping", headers={"X-CSRF-Token": token}).status_code == 200
+
+    def test_csrf_tokens_are_single_use(self):
+        """Test pooled CSRF tokens are never handed out twice."""
+        from app.core.csrf import TOKEN_POOL_SIZE, CSRFMiddleware
+
+        tokens = [CSRFMiddleware._generate_token() for _ in range(TOKEN_POOL_SIZE + 10)]
+
+        assert len(set(tokens)) == len(tokens)
+        assert all(len(token) == 43 for token in tokens)
+
 
 from unittest.mock import patch  # noqa: E402
 
@@ -105,3 +253,20 @@ class TestLogfireSetup:
         app = FastAPI()
         instrument_app(app)
         mock_logfire.instrument_fastapi.assert_called()
+
+    @patch("app.core.logfire_setup._instrumented", set())
+    @patch("app.core.logfire_setup.logfire")
+    def test_instrumentation_is_idempotent(self, mock_logfire):
+        """Test repeated instrumentation calls only instrument once."""
+        from fastapi import FastAPI
+
+        from app.core.logfire_setup import instrument_app, instrument_asyncpg
+
+        app = FastAPI()
+        instrument_app(app)
+        instrument_app(app)
+        instrument_asyncpg()
+        instrument_asyncpg()
+
+        mock_logfire.instrument_fastapi.assert_called_once_with(app)
+        mock_logfire.instrument_asyncpg.assert_called_once()
@@ -80,18 +80,13 @@ class TestBaseRepository:
         """Test create adds a new model."""
         create_data = MockCreateSchema(name="new item")
 
-        # Mock the model creation
-        async def refresh_side_effect(obj):
-            obj.id = uuid4()
-
-        mock_session.refresh.side_effect = refresh_side_effect
-
         result = await repository.create(mock_session, obj_in=create_data)
 
         assert result.name == "new item"
         mock_session.add.assert_called_once()
         mock_session.flush.assert_called_once()
-        mock_session.refresh.assert_called_once()
+        # Server defaults are returned by the INSERT, so no extra SELECT
+        mock_session.refresh.assert_not_called()
 
     @pytest.mark.anyio
     async def test_update_with_schema(self, repository, mock_session):
@@ -102,8 +97,8 @@ class TestBaseRepository:
         result = await repository.update(mock_session, db_obj=db_obj, obj_in=update_data)
 
         assert result.name == "new name"
-        mock_session.add.assert_called_once()
         mock_session.flush.assert_called_once()
+        mock_session.refresh.assert_not_called()
 
     @pytest.mark.anyio
     async def test_update_with_dict(self, repository, mock_session):
@@ -116,26 +111,38 @@ class TestBaseRepository:
         assert result.name == "new name"
 
     @pytest.mark.anyio
-    async def test_delete_removes_and_returns_model(self, repository, mock_session):
-        """Test delete removes and returns model."""
-        mock_obj = MockModel(name="to delete")
-        mock_session.get.return_value = mock_obj
+    async def test_delete_removes_and_returns_model(self, mock_session):
+        """Test delete issues one DELETE ... RETURNING and returns the row."""
+        from app.db.models.item import Item
 
-        result = await repository.delete(mock_session, id=mock_obj.id)
+        repository = BaseRepository(Item)
+        deleted = Item(id=uuid4(), title="to delete")
+        mock_result = MagicMock()
+        mock_result.scalar_one_or_none.return_value = deleted
+        mock_session.execute.return_value = mock_result
 
-        assert result == mock_obj
-        mock_session.delete.assert_called_once_with(mock_obj)
-        mock_session.flush.assert_called_once()
+        result = await repository.delete(mock_session, id=deleted.id)
+
+        assert result == deleted
+        mock_session.execute.assert_called_once()
+        statement = str(mock_session.execute.call_args.args[0])
+        assert statement.startswith("DELETE FROM items")
+        assert "RETURNING" in statement
+        mock_session.get.assert_not_called()
 
     @pytest.mark.anyio
-    async def test_delete_returns_none_when_not_found(self, repository, mock_session):
+    async def test_delete_returns_none_when_not_found(self, mock_session):
         """Test delete returns None when not found."""
-        mock_session.get.return_value = None
+        from app.db.models.item import Item
+
+        repository = BaseRepository(Item)
+        mock_result = MagicMock()
+        mock_result.scalar_one_or_none.return_value = None
+        mock_session.execute.return_value = mock_result
 
         result = await repository.delete(mock_session, id=uuid4())
 
         assert result is None
-        mock_session.delete.assert_not_called()
 
 
 class TestUserRepository:
@@ -174,3 +181,65 @@ class TestUserRepository:
         result = await user_repo.get_by_email(mock_session, "notfound@example.com")
 
         assert result is None
+
+    @pytest.mark.anyio
+    async def test_delete_issues_delete_returning(self, mock_session):
+        """Test delete runs one DELETE ... RETURNING and returns the row."""
+        from app.repositories import user as user_repo
+
+        mock_user = MagicMock()
+        mock_result = MagicMock()
+        mock_result.scalar_one_or_none.return_value = mock_user
+        mock_session.execute.return_value = mock_result
+
+        result = await user_repo.delete(mock_session, uuid4())
+
+        assert result == mock_user
+        stmt = mock_session.execute.call_args.args[0]
+        assert stmt.is_delete
+
+
+class TestBidDocumentRepository:
+    """Tests for the bid document repository."""
+
+    @pytest.mark.anyio
+    async def test_get_by_id_loads_content_only_on_request(self):
+        """Test content_text is left out of get_by_id unless asked for."""
+        from sqlalchemy.dialects import postgresql
+
+        from app.repositories.bid_document import BidDocumentRepository
+
+        session = MagicMock()
+        session.execute = AsyncMock()
+        repo = BidDocumentRepository(session)
+
+        def selected_sql():
+            stmt = session.execute.call_args.args[0]
+            return str(stmt.compile(dialect=postgresql.dialect()))
+
+        await repo.get_by_id(uuid4(), uuid4())
+        assert "content_text" not in selected_sql()
+
+        await repo.get_by_id(uuid4(), uuid4(), with_content=True)
+        assert "content_text" in selected_sql()
+
+    @pytest.mark.anyio
+    async def test_get_list_by_user_returns_page_and_total(self):
+        """Test the total count comes back with the page from one statement."""
+        from collections import namedtuple
+
+        from app.repositories.bid_document import BidDocumentRepository
+
+        Row = namedtuple("Row", ["BidDocument", "total"])
+        docs = [MagicMock(), MagicMock()]
+        result = MagicMock()
+        result.all.return_value = [Row(doc, 7) for doc in docs]
+        session = MagicMock()
+        session.execute = AsyncMock(return_value=result)
+        repo = BidDocumentRepository(session)
+
+        assert await repo.get_list_by_user(uuid4(), skip=0, limit=2) == (docs, 7)
+        session.execute.assert_called_once()
+
+        result.all.return_value = []
+        assert await repo.get_list_by_user(uuid4(), skip=10) == ([], 0)
@@ -39,6 +39,13 @@ class TestPasswordHashing:
 
         assert verify_password(wrong_password, hashed) is False
 
+    def test_hash_password_custom_rounds(self):
+        """Test the bcrypt cost can be overridden."""
+        hashed = get_password_hash("mysecretpassword", rounds=4)
+
+        assert hashed.startswith("$2b$04$")
+        assert verify_password("mysecretpassword", hashed) is True
+
 
 class TestAccessToken:
     """Tests for access token functions."""
@@ -88,6 +95,19 @@ class TestAccessToken:
 
         assert payload is None
 
+    def test_verify_token_wrong_key_or_algorithm(self):
+        """Test tokens signed with another key or algorithm are rejected."""
+        import jwt
+
+        from app.core.config import settings
+
+        claims = {"sub": "user123", "type": "access"}
+        other_key = jwt.encode(claims, "x" * 64, algorithm=settings.ALGORITHM)
+        other_alg = jwt.encode(claims, settings.SECRET_KEY * 2, algorithm="HS512")
+
+        assert verify_token(other_key) is None
+        assert verify_token(other_alg) is None
+
 
 class TestRefreshToken:
     """Tests for refresh token functions."""
@@ -122,6 +122,34 @@ class TestUserServicePostgresql:
             with pytest.raises(AlreadyExistsError):
                 await user_service.register(user_in)
 
+    @pytest.mark.anyio
+    async def test_register_superuser_in_one_insert(
+        self, user_service: UserService, mock_user: MockUser
+    ):
+        """Test is_superuser is passed to the INSERT instead of set afterwards."""
+        with (
+            patch("app.services.user.user_repo") as mock_repo,
+            patch("app.services.user.get_password_hash", return_value="hashed"),
+        ):
+            mock_repo.get_by_email = AsyncMock(return_value=None)
+            mock_repo.create = AsyncMock(return_value=mock_user)
+
+            user_in = UserCreate(email="admin@example.com", password="password123")
+            await user_service.register(user_in, is_superuser=True)
+
+            assert mock_repo.create.call_args.kwargs["is_superuser"] is True
+
+    @pytest.mark.anyio
+    async def test_set_role_not_found(self, user_service: UserService):
+        """Test changing the role of an unknown user raises NotFoundError."""
+        from app.db.models.user import UserRole
+
+        with patch("app.services.user.user_repo") as mock_repo:
+            mock_repo.update_role_by_email = AsyncMock(return_value=None)
+
+            with pytest.raises(NotFoundError):
+                await user_service.set_role("missing@example.com", UserRole.ADMIN)
+
     @pytest.mark.anyio
     async def test_authenticate_success(self, user_service: UserService, mock_user: MockUser):
         """Test successful authentication."""
@@ -214,3 +242,61 @@ class TestUserServicePostgresql:
 
             with pytest.raises(NotFoundError):
                 await user_service.delete(uuid4())
+
+
+class TestBidDocumentService:
+    """Tests for BidDocumentService."""
+
+    @pytest.mark.anyio
+    async def test_upload_removes_file_when_record_creation_fails(self, tmp_path):
+        """Test a failed INSERT doesn't leave an orphaned file behind."""
+        from app.services.bid_document import BidDocumentService
+
+        async def chunks():
+            yield b"bid "
+            yield b"content"
+
+        service = BidDocumentService(AsyncMock(), upload_dir=str(tmp_path))
+        service.repo.create = AsyncMock(side_effect=RuntimeError("insert failed"))
+
+        with pytest.raises(RuntimeError):
+            await service.upload_file(chunks(), "bid.txt", "text/plain", uuid4())
+
+        assert service.repo.create.call_args.kwargs["file_size"] == 11
+        assert list(tmp_path.iterdir()) == []
+
+    @pytest.mark.anyio
+    async def test_run_analysis_rolls_back_before_marking_failed(self):
+        """Test a failed analysis rolls the session back, then records "failed"."""
+        from contextlib import asynccontextmanager
+
+        from app.services import bid_document
+
+        session = AsyncMock()
+        doc = object()
+        calls = []
+        session.rollback = AsyncMock(side_effect=lambda: calls.append("rollback"))
+
+        @asynccontextmanager
+        async def db_context():
+            yield session
+
+        with (
+            patch.object(bid_document, "get_db_context", db_context),
+            patch.object(
+                bid_document.BidDocumentRepository, "get_by_id", AsyncMock(return_value=doc)
+            ),
+            patch.object(
+                bid_document.BidDocumentRepository,
+                "update_status",
+                AsyncMock(side_effect=lambda d, status: calls.append(status)),
+            ),
+            patch.object(
+                bid_document.BidDocumentService,
+                "analyze",
+                AsyncMock(side_effect=RuntimeError("flush failed")),
+            ),
+        ):
+            await bid_document.run_analysis(uuid4(), uuid4())
+
+        assert calls == ["rollback", "failed"]